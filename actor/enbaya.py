@@ -365,18 +365,16 @@ def _slerp_quat(q0, q1, t):
         dot = -dot
 
     if dot > 0.9995:
-        # Very close — use linear interpolation
-        result = (
-            _lerp(q0[0], q1[0], t),
-            _lerp(q0[1], q1[1], t),
-            _lerp(q0[2], q1[2], t),
-            _lerp(q0[3], q1[3], t),
-        )
-        length_sq = sum(v*v for v in result)
+        # Very close — use linear interpolation, renormalized in place
+        x = _lerp(q0[0], q1[0], t)
+        y = _lerp(q0[1], q1[1], t)
+        z = _lerp(q0[2], q1[2], t)
+        w = _lerp(q0[3], q1[3], t)
+        length_sq = x * x + y * y + z * z + w * w
         if length_sq > 1e-15:
             inv_len = 1.0 / math.sqrt(length_sq)
-            result = tuple(v * inv_len for v in result)
-        return result
+            return (x * inv_len, y * inv_len, z * inv_len, w * inv_len)
+        return (x, y, z, w)
 
     theta = math.acos(min(dot, 1.0))
     sin_theta = math.sin(theta)
@@ -393,13 +391,15 @@ def _slerp_quat(q0, q1, t):
     )
 
 
-def decompress_enbaya(data, endian='<', fps=30.0):
+def decompress_enbaya(data, endian='<', fps=30.0, stream=None):
     """Decompress an Enbaya animation stream into per-track keyframes.
 
     Args:
         data: Raw bytes of the igEnbayaAnimationSource._enbayaAnimationStream.
         endian: '<' for little-endian, '>' for big-endian.
         fps: Output sample rate in frames per second.
+        stream: Optional EnbayaStream already parsed from `data` (e.g. for
+            header validation); its header is reused instead of re-read.
 
     Returns:
         Tuple of (track_count, duration, keyframes) where keyframes is a list
@@ -407,7 +407,8 @@ def decompress_enbaya(data, endian='<', fps=30.0):
         (quat_xyzw, trans_xyz) tuples.
         Quaternion order is XYZW (Alchemy convention).
     """
-    stream = EnbayaStream(data, 0, endian)
+    if stream is None:
+        stream = EnbayaStream(data, 0, endian)
 
     if stream.track_count == 0 or stream.duration <= 0.0:
         return 0, 0.0, []
@@ -657,20 +658,22 @@ def decompress_enbaya(data, endian='<', fps=30.0):
     return track_count, stream.duration, keyframes
 
 
-def decompress_enbaya_to_tracks(data, endian='<', fps=30.0):
+def decompress_enbaya_to_tracks(data, endian='<', fps=30.0, stream=None):
     """Decompress Enbaya data and return per-track keyframe lists.
 
     Args:
         data: Raw bytes of the Enbaya stream.
         endian: '<' for little-endian, '>' for big-endian.
         fps: Output sample rate.
+        stream: Optional pre-parsed EnbayaStream header for `data`.
 
     Returns:
         List of track_count elements, each being a list of
         (time_ms, quat_wxyz, trans_xyz) tuples.
         Quaternion order is WXYZ (Blender convention).
     """
-    track_count, duration, keyframes = decompress_enbaya(data, endian, fps)
+    track_count, duration, keyframes = decompress_enbaya(
+        data, endian, fps, stream=stream)
 
     if not keyframes or track_count == 0:
         return []
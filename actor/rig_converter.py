@@ -11,8 +11,23 @@ Usage:
 """
 
 import json
+import math
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+# Optional: numba-compiled pose-bake kernel (not bundled with Blender)
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = _HAS_NUMPY
+except ImportError:
+    _HAS_NUMBA = False
+
 # ============================================================================
 # XML2 Target Skeleton Definition (35 bones)
 # ============================================================================
@@ -64,6 +79,46 @@ XML2_BONE_NAMES = {entry[0] for entry in XML2_SKELETON}
 XML2_JOINT_COUNT = sum(1 for _, _, _, bm, _ in XML2_SKELETON if bm >= 0)
 
 
+_SKELETON_DISPLAY_TABLES = {}
+
+
+def _skeleton_display_table(skeleton):
+    """Blender display names for a skeleton definition, built once per table.
+
+    The unnamed root is "Bone_000" in Blender. Returns two tuples indexed
+    like the skeleton: each entry's display name and its parent's display
+    name (None for roots). Skeleton lists are module-level constants, so
+    they are keyed by identity.
+    """
+    table = _SKELETON_DISPLAY_TABLES.get(id(skeleton))
+    if table is None:
+        names = tuple(entry[0] or "Bone_000" for entry in skeleton)
+        parents = tuple(names[entry[2]] if entry[2] >= 0 else None
+                        for entry in skeleton)
+        table = (names, parents)
+        _SKELETON_DISPLAY_TABLES[id(skeleton)] = table
+    return table
+
+
+_XML2_DISPLAY_NAMES, _XML2_PARENT_DISPLAY = _skeleton_display_table(
+    XML2_SKELETON)
+
+# XML2 parent display name -> child display names
+_XML2_CHILDREN = MappingProxyType({
+    parent: tuple(name for name, p in zip(_XML2_DISPLAY_NAMES,
+                                          _XML2_PARENT_DISPLAY)
+                  if p == parent)
+    for parent in _XML2_PARENT_DISPLAY if parent is not None})
+
+# Per-field views of XML2_SKELETON for the skeleton-build passes, which
+# index by bone rather than unpacking every entry. Entry i has index i.
+_XML2_NAMES = tuple(entry[0] for entry in XML2_SKELETON)
+_XML2_PARENT_IDX = tuple(entry[2] for entry in XML2_SKELETON)
+_XML2_DEFORM_IDX = tuple(entry[1] for entry in XML2_SKELETON if entry[3] >= 0)
+_XML2_ROOT_IDX = tuple(entry[1] for entry in XML2_SKELETON if entry[2] < 0)
+_XML2_CHILD_IDX = tuple(entry[1] for entry in XML2_SKELETON if entry[2] >= 0)
+
+
 # ============================================================================
 # MUA Extended Skeleton (XML2 base + FX bones)
 # ============================================================================
@@ -181,10 +236,17 @@ def get_skeleton_for_game(game: str, full_fingers: bool = False):
     return XML2_SKELETON
 
 
+_MUA_FULL_FINGER_BONE_NAMES = None
+
+
 def get_bone_names_for_game(game: str, full_fingers: bool = False):
     """Return set of bone names for the specified target game."""
+    global _MUA_FULL_FINGER_BONE_NAMES
     if full_fingers and game == 'MUA':
-        return {e[0] for e in get_skeleton_for_game(game, full_fingers=True)}
+        if _MUA_FULL_FINGER_BONE_NAMES is None:
+            _MUA_FULL_FINGER_BONE_NAMES = {
+                e[0] for e in get_skeleton_for_game(game, full_fingers=True)}
+        return _MUA_FULL_FINGER_BONE_NAMES
     if game == 'MUA':
         return MUA_BONE_NAMES
     return XML2_BONE_NAMES
@@ -746,6 +808,21 @@ for _k, _v in _bone_tables.build_merge_lookup().items():
 for _k, (_v, _p) in CATS_RENAME_LOOKUP.items():
     ALIAS_TO_XML2.setdefault(_k, _v)
 
+# The alias/merge tables are complete — freeze them as read-only views so a
+# stray write at runtime can't change rename results. Rebuilding the dicts
+# also sizes each hash table exactly once instead of keeping the slack left
+# over from the incremental inserts above.
+ALIAS_TO_XML2 = MappingProxyType(dict(ALIAS_TO_XML2))
+UNITY_TO_XML2 = ALIAS_TO_XML2
+MERGE_WEIGHT_TARGETS = MappingProxyType(dict(MERGE_WEIGHT_TARGETS))
+
+# Combined rename lookup: alias -> (target, priority). CATS entries carry
+# their own priority and win over legacy aliases (fixed priority 500), so a
+# single probe per key replaces the CATS-then-legacy double lookup.
+_RENAME_PRIORITY_LOOKUP = {_k: (_v, 500) for _k, _v in ALIAS_TO_XML2.items()}
+_RENAME_PRIORITY_LOOKUP.update(CATS_RENAME_LOOKUP)
+_RENAME_PRIORITY_LOOKUP = MappingProxyType(_RENAME_PRIORITY_LOOKUP)
+
 # Bones the weight-merge ancestor fallback must never target (non-deforming)
 _NON_DEFORM_TARGETS = {"", "Bone_000", "Bip01", "Motion"} | MUA_FX_BONE_NAMES
 
@@ -798,6 +875,73 @@ NATIVE_BONE_ROTATIONS = {
     "Bip01 R Toe0":     ( 0.697742, -0.697742,  0.114700,  0.114700),
 }
 
+# Matrix forms of NATIVE_BONE_ROTATIONS, built on first use (mathutils only
+# imports inside Blender) and shared by the bind, translation and bone
+# display passes. Values are shared — copy before mutating in place.
+_NATIVE_BIND_ROTATIONS = None
+_NATIVE_DISPLAY_AXES = None
+_NATIVE_ROTATION_ARRAY = None
+
+
+def _conjugate_quat_rows(w, x, y, z):
+    """Rows of the 3x3 rotation of the CONJUGATE of unit quaternion (w,x,y,z).
+
+    Closed-form expansion, i.e. Quaternion((w, x, y, z)).conjugated()
+    .to_matrix() without the intermediate objects. Conjugating converts
+    Alchemy convention to Blender convention.
+    """
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+    return ((1.0 - 2.0 * (yy + zz), 2.0 * (xy + wz), 2.0 * (xz - wy)),
+            (2.0 * (xy - wz), 1.0 - 2.0 * (xx + zz), 2.0 * (yz + wx)),
+            (2.0 * (xz + wy), 2.0 * (yz - wx), 1.0 - 2.0 * (xx + yy)))
+
+
+def _native_bind_rotations():
+    """Bone name -> native 3x3 rotation in game space, Blender convention."""
+    global _NATIVE_BIND_ROTATIONS
+    if _NATIVE_BIND_ROTATIONS is None:
+        from mathutils import Matrix
+        _NATIVE_BIND_ROTATIONS = MappingProxyType({
+            name: Matrix(_conjugate_quat_rows(*q))
+            for name, q in NATIVE_BONE_ROTATIONS.items()})
+    return _NATIVE_BIND_ROTATIONS
+
+
+def _native_rotation_array():
+    """Numpy form of _native_bind_rotations, for the batched bind path.
+
+    Returns:
+        (index, rotations): bone name -> row in ``rotations``, an (N, 3, 3)
+        array of every native rotation, all expanded in one vectorised
+        pass.
+    """
+    global _NATIVE_ROTATION_ARRAY
+    if _NATIVE_ROTATION_ARRAY is None:
+        quats = np.array(list(NATIVE_BONE_ROTATIONS.values()),
+                         dtype=np.float64)
+        rows = np.array(_conjugate_quat_rows(*quats.T))  # (3, 3, N)
+        _NATIVE_ROTATION_ARRAY = (
+            MappingProxyType({name: i for i, name
+                              in enumerate(NATIVE_BONE_ROTATIONS)}),
+            rows.transpose(2, 0, 1))
+    return _NATIVE_ROTATION_ARRAY
+
+
+def _native_display_axes():
+    """Bone name -> native bone Y axis (tail direction) in armature space."""
+    global _NATIVE_DISPLAY_AXES
+    if _NATIVE_DISPLAY_AXES is None:
+        from mathutils import Matrix
+        # Game space -> Blender armature space. The bone Y axis is the
+        # second column of the (already conjugated) native rotation.
+        rz90_inv = Matrix.Rotation(math.radians(-90), 3, 'Z')
+        _NATIVE_DISPLAY_AXES = MappingProxyType({
+            name: rz90_inv @ rot.col[1]
+            for name, rot in _native_bind_rotations().items()})
+    return _NATIVE_DISPLAY_AXES
+
 # ============================================================================
 # Native XML2 Inverse Joint Matrices (extracted from 0601.igb) — reference
 # ============================================================================
@@ -896,10 +1040,9 @@ def _rename_bip_prefix(armature_obj, old_prefix, new_prefix):
 
     # Build rename map: only rename bones that start with old_prefix
     rename_map = {}
-    for bone in armature_obj.data.bones:
-        if bone.name.startswith(old_prefix):
-            new_name = new_prefix + bone.name[len(old_prefix):]
-            rename_map[bone.name] = new_name
+    for name in armature_obj.data.bones.keys():
+        if name.startswith(old_prefix):
+            rename_map[name] = new_prefix + name[len(old_prefix):]
 
     if not rename_map:
         return
@@ -931,7 +1074,7 @@ def _detect_bip_prefix(armature_obj):
     Returns:
         The prefix string (e.g. "Bip01", "Bip001") or None if not a Biped rig.
     """
-    bone_names = [b.name for b in armature_obj.data.bones]
+    bone_names = armature_obj.data.bones.keys()
     # Count bones by prefix — check common 3ds Max Biped variants
     for prefix in ("Bip01", "Bip001", "Bip002"):
         count = sum(1 for n in bone_names if n.startswith(prefix))
@@ -972,12 +1115,12 @@ def detect_rig_profile(armature_obj):
     # Universal detection: try normalizing each bone and looking up.
     # Counts direct aliases, finger-classified bones, and spine-chain bones.
     matched = 0
-    for bone in armature_obj.data.bones:
-        norm_low = _normalize_bone_name(bone.name).lower()
-        if (_lookup_bone(bone.name) is not None
+    for name in armature_obj.data.bones.keys():
+        norm_low = _normalize_bone_name(name).lower()
+        if (_lookup_bone(name) is not None
                 or _bone_tables.classify_finger(norm_low) is not None
                 or norm_low in SPINE_ALIAS_SET
-                or bone.name.lower() in SPINE_ALIAS_SET):
+                or name.lower() in SPINE_ALIAS_SET):
             matched += 1
             if matched >= 3:
                 return 'universal'
@@ -1033,12 +1176,9 @@ def _lookup_bone_priority(name, target_game='XML2'):
             fx = ALIAS_TO_MUA_FX.get(key)
             if fx:
                 return fx, 0 + penalty
-        hit = CATS_RENAME_LOOKUP.get(key)
+        hit = _RENAME_PRIORITY_LOOKUP.get(key)
         if hit:
             return hit[0], hit[1] + penalty
-        legacy = ALIAS_TO_XML2.get(key)
-        if legacy:
-            return legacy, 500 + penalty
 
     return None
 
@@ -1075,10 +1215,9 @@ def _conflict_demotions(armature_obj):
     """
     # Map both raw and normalized lowercase names to actual bone names
     name_lookup = {}
-    for bone in armature_obj.data.bones:
-        name_lookup.setdefault(bone.name.lower(), bone.name)
-        name_lookup.setdefault(_normalize_bone_name(bone.name).lower(),
-                               bone.name)
+    for name in armature_obj.data.bones.keys():
+        name_lookup.setdefault(name.lower(), name)
+        name_lookup.setdefault(_normalize_bone_name(name).lower(), name)
 
     demotions = {}
     for required_set, demoted, merge_target in _CONFLICT_RULES:
@@ -1487,10 +1626,10 @@ def build_rename_map(armature_obj, profile=None, target_game='XML2',
 
     # General pass: best-priority candidate per target wins
     candidates = {}  # target -> (priority, bone_name)
-    for bone in armature_obj.data.bones:
-        if bone.name in handled:
+    for name in armature_obj.data.bones.keys():
+        if name in handled:
             continue
-        hit = _lookup_bone_priority(bone.name, target_game=target_game)
+        hit = _lookup_bone_priority(name, target_game=target_game)
         if hit is None:
             continue
         target, priority = hit
@@ -1498,7 +1637,7 @@ def build_rename_map(armature_obj, profile=None, target_game='XML2',
             continue
         best = candidates.get(target)
         if best is None or priority < best[0]:
-            candidates[target] = (priority, bone.name)
+            candidates[target] = (priority, name)
 
     for target, (_priority, bone_name) in candidates.items():
         rename_map[bone_name] = target
@@ -1680,7 +1819,6 @@ def _fit_skeleton_to_native(armature_obj, target_game='XML2', operator=None):
     stored, but BEFORE inv_bind/translation computation.
     """
     import bpy
-    import math
     from mathutils import Quaternion, Vector
 
     # Total export scale (matches the exporter's composition)
@@ -1813,7 +1951,7 @@ def _place_missing_finger(eb, bone_name, edit_bones):
     Args:
         eb: The new edit bone.
         bone_name: Full XML2 name, e.g. 'Bip01 L Finger0'.
-        edit_bones: armature.data.edit_bones.
+        edit_bones: armature.data.edit_bones, or a name -> EditBone dict.
 
     Returns:
         True if placed (head set), False if the hand bone is unusable.
@@ -1850,6 +1988,115 @@ def _place_missing_finger(eb, bone_name, edit_bones):
     return True
 
 
+def _avg_bone_length(bones):
+    """Mean length of the non-degenerate (> 0.001) bones, 0.05 if none.
+
+    Sizes dummy bones. Takes any bone collection (edit_bones included);
+    lengths are read in one foreach_get call when numpy is available.
+    """
+    if _HAS_NUMPY:
+        lengths = np.empty(len(bones), dtype=np.float64)
+        bones.foreach_get("length", lengths)
+        lengths = lengths[lengths > 0.001]
+        return float(lengths.mean()) if lengths.size else 0.05
+    lengths = [b.length for b in bones if b.length > 0.001]
+    return sum(lengths) / len(lengths) if lengths else 0.05
+
+
+def _create_missing_skeleton_bones(edit_bones, eb_by_name, skeleton,
+                                   avg_bone_len):
+    """Create the skeleton's missing bones and fix the whole hierarchy.
+
+    Shared by convert_rig and setup_bip01_rig (EDIT mode). Walks the
+    skeleton in index order so parents exist before their children;
+    dummies are small bones placed after their parent's tail, with special
+    cases for the upper spine, ponytails, fingers and the origin bones.
+    Every skeleton bone present is then re-parented to match.
+
+    Args:
+        edit_bones: armature.data.edit_bones.
+        eb_by_name: name -> EditBone for this edit session (updated here).
+        skeleton: target skeleton definition (see get_skeleton_for_game).
+        avg_bone_len: reference length; dummies are 30% of it.
+
+    Returns:
+        Set of display names of the bones created.
+    """
+    from mathutils import Vector
+
+    display_names, parent_displays = _skeleton_display_table(skeleton)
+    small_len = avg_bone_len * 0.3  # dummy bones are small
+    created = set()
+
+    for (name, idx, parent_idx, bm_idx, flags), display_name, \
+            parent_bone_name in zip(skeleton, display_names, parent_displays):
+        if display_name in eb_by_name:
+            continue  # Already exists (was renamed from source bone)
+
+        eb = edit_bones.new(display_name)
+        eb_by_name[display_name] = eb
+
+        parent_eb = (eb_by_name.get(parent_bone_name)
+                     if parent_bone_name is not None else None)
+        if parent_eb:
+            eb.parent = parent_eb
+
+            # Smart placement: place dummy at parent's TAIL (end)
+            # so it chains naturally after existing bones
+            eb.head = parent_eb.tail.copy()
+
+            # Special cases for better visual placement
+            finger_placed = False
+            if name == "Bip01 Spine2":
+                # UpperChest: place between Chest (Spine1) and Neck
+                neck_eb = eb_by_name.get("Bip01 Neck")
+                if neck_eb:
+                    eb.head = (parent_eb.tail + neck_eb.head) * 0.5
+            elif name.startswith("Bip01 Ponytail"):
+                # Ponytails: place behind head, extending upward
+                head_eb = eb_by_name.get("Bip01 Head")
+                if head_eb:
+                    eb.head = head_eb.tail.copy()
+                    if name == "Bip01 Ponytail11":
+                        pony1 = eb_by_name.get("Bip01 Ponytail1")
+                        if pony1:
+                            eb.head = pony1.tail.copy()
+            elif " Finger" in name:
+                # Fingers: anchor to the hand bone using native XML2
+                # proportions (hand tail can point anywhere on imports)
+                finger_placed = _place_missing_finger(eb, name, eb_by_name)
+            elif name in ("Bip01", "Motion"):
+                # Structural bones start at the origin
+                eb.head = Vector((0, 0, 0))
+
+            if not finger_placed:
+                # Compute tail: extend in same direction as parent
+                parent_dir = parent_eb.tail - parent_eb.head
+                if parent_dir.length > 0.001:
+                    eb.tail = eb.head + parent_dir.normalized() * small_len
+                else:
+                    eb.tail = eb.head + Vector((0, small_len, 0))
+        else:
+            # Root bone, or parent missing
+            eb.head = Vector((0, 0, 0))
+            eb.tail = Vector((0, small_len, 0))
+
+        eb.use_connect = False
+        created.add(display_name)
+
+    # Fix parent relationships for ALL skeleton bones (renamed ones may
+    # need re-parenting to match the target hierarchy)
+    for display_name, parent_display in zip(display_names, parent_displays):
+        eb = eb_by_name.get(display_name)
+        if not eb or parent_display is None:
+            continue
+        parent_eb = eb_by_name.get(parent_display)
+        if parent_eb and eb.parent != parent_eb:
+            eb.parent = parent_eb
+
+    return created
+
+
 # ============================================================================
 # Transform Application & Auto-Scale
 # ============================================================================
@@ -1951,60 +2198,116 @@ ARM_CHAIN_BONES = {
 }
 
 
-def _detect_source_pose(armature_obj, rename_map=None):
-    """Detect whether the source rig is in T-pose or A-pose.
-
-    Measures the elevation angle of UpperArm bones relative to the horizontal
-    plane.  Uses PRE-rename bone names (the original Unity/Mixamo names) via
-    the rename_map to find the UpperArm bones before they've been renamed.
+def _elevation_angles(directions):
+    """Signed elevation (radians) of each direction above the XY plane.
 
     Args:
-        armature_obj: Blender armature object (before rename).
-        rename_map: Dict mapping old_name -> xml2_name.  If None, assumes
-                    bones already have XML2 names.
+        directions: sequence of 3-vectors (Blender Z-up, armature space).
 
     Returns:
-        'T_POSE' if arms are nearly horizontal (< 15° from XY plane),
-        'A_POSE' if arms are angled down (25-65° below horizontal),
-        'UNKNOWN' if detection fails or angle is ambiguous.
+        List aligned with directions; None where the direction is shorter
+        than 0.0001 (no usable angle).
     """
-    import math
+    if not directions:
+        return []
+    if _HAS_NUMPY:
+        dirs = np.array([tuple(d) for d in directions], dtype=np.float64)
+        lengths = np.linalg.norm(dirs, axis=1)
+        elevations = np.arctan2(dirs[:, 2], np.hypot(dirs[:, 0], dirs[:, 1]))
+        return [float(e) if length >= 0.0001 else None
+                for e, length in zip(elevations, lengths)]
+
+    result = []
+    for d in directions:
+        if math.sqrt(d[0] ** 2 + d[1] ** 2 + d[2] ** 2) < 0.0001:
+            result.append(None)
+            continue
+        result.append(math.atan2(d[2], math.sqrt(d[0] ** 2 + d[1] ** 2)))
+    return result
+
+
+# Arms already within this angle (radians, = 1°) of the target elevation
+# are left alone by _repose_meshes.
+_REPOSE_MIN_ANGLE = 0.017453292519943295
+
+
+def _measure_arm_chain(armature_obj, rename_map=None):
+    """Measure both upper arms once: bone direction and arm elevation.
+
+    Shared by _detect_source_pose (classification) and _repose_meshes
+    (delta rotation) so the arm bones are read from the armature once.
+
+    Args:
+        armature_obj: Blender armature object.
+        rename_map: Dict mapping old_name -> xml2_name, for rigs that are
+                    not renamed yet. If None, bones already have XML2 names.
 
+    Returns:
+        Dict side ('L'/'R') -> (upper_bone_name, upper_bone_dir, elevation).
+        upper_bone_dir is the UpperArm's own head->tail vector; elevation is
+        the signed angle (radians, negative = downward) of the arm, measured
+        upperarm head -> forearm head (or upperarm tail). Missing or
+        degenerate arms are omitted.
+    """
     # Build reverse map: xml2_name -> current_bone_name
     if rename_map:
         reverse = {v: k for k, v in rename_map.items()}
     else:
         reverse = {}
 
-    angles = []
-    for side_upper, side_fore in [
-        ("Bip01 L UpperArm", "Bip01 L Forearm"),
-        ("Bip01 R UpperArm", "Bip01 R Forearm"),
-    ]:
+    bones = armature_obj.data.bones
+    sides = []
+    bone_dirs = []
+    arm_dirs = []
+    for side in ('L', 'R'):
         # Resolve to current bone names
-        upper_name = reverse.get(side_upper, side_upper)
-        fore_name = reverse.get(side_fore, side_fore)
-
-        upper_bone = armature_obj.data.bones.get(upper_name)
-        fore_bone = armature_obj.data.bones.get(fore_name)
+        upper_name = reverse.get(f"Bip01 {side} UpperArm",
+                                 f"Bip01 {side} UpperArm")
+        fore_name = reverse.get(f"Bip01 {side} Forearm",
+                                f"Bip01 {side} Forearm")
 
+        upper_bone = bones.get(upper_name)
         if upper_bone is None:
             continue
+        fore_bone = bones.get(fore_name)
 
-        # Arm direction: upperarm head -> forearm head (or upperarm tail)
+        head = upper_bone.head_local
+        bone_dir = upper_bone.tail_local - head
+        sides.append((side, upper_name))
+        bone_dirs.append(bone_dir)
         if fore_bone is not None:
-            arm_dir = fore_bone.head_local - upper_bone.head_local
+            arm_dirs.append(fore_bone.head_local - head)
         else:
-            arm_dir = upper_bone.tail_local - upper_bone.head_local
+            arm_dirs.append(bone_dir)
+
+    result = {}
+    for (side, upper_name), bone_dir, elevation in zip(
+            sides, bone_dirs, _elevation_angles(arm_dirs)):
+        if elevation is not None:
+            result[side] = (upper_name, bone_dir, elevation)
+    return result
 
-        if arm_dir.length < 0.0001:
-            continue
 
-        # Elevation angle from horizontal (XY plane in Blender Z-up)
-        horizontal_len = math.sqrt(arm_dir.x ** 2 + arm_dir.y ** 2)
-        elevation = math.degrees(math.atan2(abs(arm_dir.z), horizontal_len))
-        angles.append(elevation)
+def _detect_source_pose(armature_obj, rename_map=None):
+    """Detect whether the source rig is in T-pose or A-pose.
 
+    Measures the elevation angle of UpperArm bones relative to the horizontal
+    plane.  Uses PRE-rename bone names (the original Unity/Mixamo names) via
+    the rename_map to find the UpperArm bones before they've been renamed.
+
+    Args:
+        armature_obj: Blender armature object (before rename).
+        rename_map: Dict mapping old_name -> xml2_name.  If None, assumes
+                    bones already have XML2 names.
+
+    Returns:
+        'T_POSE' if arms are nearly horizontal (< 15° from XY plane),
+        'A_POSE' if arms are angled down (25-65° below horizontal),
+        'UNKNOWN' if detection fails or angle is ambiguous.
+    """
+    # Elevation angle from horizontal (XY plane in Blender Z-up)
+    angles = [math.degrees(abs(elevation)) for _name, _bone_dir, elevation
+              in _measure_arm_chain(armature_obj, rename_map).values()]
     if not angles:
         return 'UNKNOWN'
 
@@ -2042,8 +2345,7 @@ def _repose_meshes(armature_obj, source_pose, target_pose):
         target_pose: 'T_POSE' or 'A_POSE'.
     """
     import bpy
-    import math
-    from mathutils import Matrix, Quaternion, Vector
+    from mathutils import Quaternion, Vector
 
     if source_pose == target_pose:
         return
@@ -2051,28 +2353,7 @@ def _repose_meshes(armature_obj, source_pose, target_pose):
     # --- 1. Measure actual arm angle and compute delta ---
     # T-pose = 0° elevation, A-pose = ~45° elevation below horizontal.
     # We measure the actual angle rather than assuming exact 45°.
-    arm_bones_info = []  # (bone_name, measured_angle, side)
-    for side, upper_name, fore_name in [
-        ('L', "Bip01 L UpperArm", "Bip01 L Forearm"),
-        ('R', "Bip01 R UpperArm", "Bip01 R Forearm"),
-    ]:
-        upper_bone = armature_obj.data.bones.get(upper_name)
-        fore_bone = armature_obj.data.bones.get(fore_name)
-        if upper_bone is None:
-            continue
-
-        if fore_bone is not None:
-            arm_dir = fore_bone.head_local - upper_bone.head_local
-        else:
-            arm_dir = upper_bone.tail_local - upper_bone.head_local
-
-        if arm_dir.length < 0.0001:
-            continue
-
-        horizontal_len = math.sqrt(arm_dir.x ** 2 + arm_dir.y ** 2)
-        elevation = math.atan2(arm_dir.z, horizontal_len)  # radians, negative = downward
-        arm_bones_info.append((upper_name, elevation, side))
-
+    arm_bones_info = _measure_arm_chain(armature_obj)
     if not arm_bones_info:
         return
 
@@ -2082,73 +2363,57 @@ def _repose_meshes(armature_obj, source_pose, target_pose):
     else:
         target_elevation = math.radians(-45.0)
 
-    # --- 2. Disconnect all bones so pose rotation works freely ---
+    # --- 2. Compute the delta rotation for each arm's UpperArm bone ---
+    # Only rest-pose bone data is read here, so this runs before any mode
+    # switch — and nothing is toggled at all when no arm can be rotated.
+    arm_rotations = []  # (bone_name, bone-local delta quaternion)
+    for upper_name, bone_dir, current_elevation in arm_bones_info.values():
+        delta_angle = target_elevation - current_elevation
+        if abs(delta_angle) < _REPOSE_MIN_ANGLE:
+            continue  # already at the target pose — nothing to bake
+
+        # Pitch the arm up/down by delta_angle about the horizontal axis
+        # perpendicular to the bone (arm direction x up). The elevation was
+        # measured upperarm head -> forearm head, so rotate by the measured
+        # delta rather than aiming the bone's own tail at the target.
+        bone = armature_obj.data.bones[upper_name]
+        rot_axis = bone_dir.normalized().cross(Vector((0, 0, 1)))
+        if rot_axis.length < 0.0001:
+            continue  # arm points straight up/down — no vertical plane
+        rot_axis.normalize()
+        delta_q = Quaternion(rot_axis, delta_angle)
+
+        # The delta in bone-local space (conjugated by the rest orientation)
+        bone_q = bone.matrix_local.to_quaternion()
+        arm_rotations.append(
+            (upper_name, bone_q.conjugated() @ delta_q @ bone_q))
+
+    if not arm_rotations:
+        return
+
+    # --- 3. Disconnect all bones so pose rotation works freely ---
     # Connected bones (use_connect=True) have their head locked to the
     # parent's tail, which prevents bpy.ops.pose.armature_apply() from
     # correctly applying the reposed positions as the new rest pose.
+    # EDIT goes straight to POSE — no OBJECT round trip in between.
     bpy.context.view_layer.objects.active = armature_obj
     armature_obj.select_set(True)
     bpy.ops.object.mode_set(mode='EDIT')
     for eb in armature_obj.data.edit_bones:
         eb.use_connect = False
-    bpy.ops.object.mode_set(mode='OBJECT')
-
-    # --- 3. Enter pose mode and set rotations ---
     bpy.ops.object.mode_set(mode='POSE')
 
-    # Clear all pose transforms first
+    # Clear all pose transforms, then set the arm rotations
     for pb in armature_obj.pose.bones:
         pb.rotation_mode = 'QUATERNION'
         pb.rotation_quaternion = Quaternion((1, 0, 0, 0))
         pb.location = Vector((0, 0, 0))
         pb.scale = Vector((1, 1, 1))
-
-    # Apply delta rotation to each arm's UpperArm bone.
-    # The rotation is around the bone's local "forward" axis (the axis
-    # pointing outward from shoulder, which is roughly ±Y in Blender space
-    # for a character facing -Y).
-    for upper_name, current_elevation, side in arm_bones_info:
-        delta_angle = target_elevation - current_elevation
-
-        pb = armature_obj.pose.bones.get(upper_name)
-        if pb is None:
-            continue
-
-        # The arm extends outward along bone Y. We want to rotate the arm
-        # up/down, which is a rotation around the arm's outward axis.
-        # In the bone's local space, Y is along the bone, so we rotate
-        # around the bone-local Y axis (roll).
-        # Actually, for arms extending to the side, the up/down rotation
-        # is around the forward axis (which is bone-local X or Z depending
-        # on the bone's roll).
-        #
-        # Simpler approach: compute the rotation axis in armature space.
-        # The arm points outward (roughly ±Y). We want to pitch it up/down.
-        # Rotation axis = arm direction cross up vector = forward/back axis.
-        bone = armature_obj.data.bones[upper_name]
-        arm_dir = bone.tail_local - bone.head_local
-        arm_dir.normalize()
-
-        # Cross with up vector to get rotation axis
-        up = Vector((0, 0, 1))
-        rot_axis = arm_dir.cross(up)
-        if rot_axis.length < 0.0001:
-            continue
-        rot_axis.normalize()
-
-        # Convert to bone-local rotation axis
-        bone_mat = bone.matrix_local.to_3x3()
-        try:
-            local_axis = bone_mat.inverted() @ rot_axis
-        except ValueError:
-            continue
-        local_axis.normalize()
-
-        # Apply the delta as a quaternion in bone-local space
-        delta_q = Quaternion(local_axis, delta_angle)
-        pb.rotation_quaternion = delta_q
+    for upper_name, delta_q in arm_rotations:
+        armature_obj.pose.bones[upper_name].rotation_quaternion = delta_q
 
     # --- 4. Bake the pose into the meshes, then apply as rest pose ---
+    # (the bake runs the single depsgraph update the pose matrices need)
     _apply_current_pose_to_meshes(armature_obj)
     bpy.ops.pose.armature_apply()
     bpy.ops.object.mode_set(mode='OBJECT')
@@ -2161,104 +2426,364 @@ def _apply_current_pose_to_meshes(armature_obj):
     carry 100-200 shape keys, which rules out modifier_apply) and writes
     the deformed positions back, rotating shape key offsets to match.
     Leaves the pose itself untouched — callers follow with armature_apply.
+
+    Uses numpy (bundled with Blender) to blend the bone matrices for all
+    vertices at once; falls back to per-vertex mathutils math without it.
     """
     import bpy
-    from mathutils import Matrix, Vector
+    from mathutils import Matrix
 
     # Force dependency graph update so pose matrices are current
     bpy.context.view_layer.update()
 
+    meshes = []
     for child in _get_skinned_meshes(armature_obj):
-        mesh = child.data
-        n_verts = len(mesh.vertices)
-
         # Find the armature modifier
-        arm_mod = None
         for mod in child.modifiers:
             if mod.type == 'ARMATURE' and mod.object == armature_obj:
-                arm_mod = mod
+                meshes.append(child)
                 break
-        if arm_mod is None:
-            continue
+    if not meshes:
+        return
 
-        # Precompute per-bone transform: pose_bone.matrix @ rest_bone.matrix_local.inverted()
+    # Per-bone transform: pose_bone.matrix @ rest_bone.matrix_local.inverted().
+    # Depends only on the armature, so it is built once for every mesh.
+    if _HAS_NUMPY:
+        # Stacked as flat row-major 4x4s so blending is one weighted sum
+        bones = armature_obj.data.bones
+        pose_bones = armature_obj.pose.bones
+        bone_index = {b.name: i for i, b in enumerate(bones)}
+        pose = np.empty(len(pose_bones) * 16, dtype=np.float32)
+        pose_bones.foreach_get("matrix", pose)
+        # Column-major like matrix_local; reordered to armature.bones order
+        pose = pose.reshape(-1, 4, 4).transpose(0, 2, 1)
+        pose_row = {pb.name: i for i, pb in enumerate(pose_bones)}
+        pose = pose[[pose_row[b.name] for b in bones]].astype(np.float64)
+        bone_mats = (pose @ _rest_inverses(armature_obj.data)).reshape(-1, 16)
+        moved = np.abs(bone_mats - np.eye(4).ravel()).max(axis=1) > 1e-5
+        moving_bones = {name for name, i in bone_index.items() if moved[i]}
+    else:
         bone_transforms = {}
         for pb in armature_obj.pose.bones:
-            bone = pb.bone
             try:
-                rest_inv = bone.matrix_local.inverted()
+                rest_inv = pb.bone.matrix_local.inverted()
             except ValueError:
                 rest_inv = Matrix.Identity(4)
             bone_transforms[pb.name] = pb.matrix @ rest_inv
+        ident = Matrix.Identity(4)
+        moving_bones = {
+            name for name, m in bone_transforms.items()
+            if any(abs(m[r][c] - ident[r][c]) > 1e-5
+                   for r in range(4) for c in range(4))}
+
+    for child in meshes:
+        # Repose passes only move a few bones (arms, thumbs); meshes not
+        # weighted to any of them (eyes, teeth, the viseme-heavy face) would
+        # come out unchanged, shape keys included, so skip them entirely.
+        if not any(vg.name in moving_bones for vg in child.vertex_groups):
+            continue
+        if _HAS_NUMPY:
+            _bake_pose_numpy(child, bone_index, bone_mats)
+        else:
+            _bake_pose_python(child, bone_transforms)
+        child.data.update()
 
-        # Precompute per-vertex weighted rotation (for shape key offsets)
-        # and deformed positions (for base mesh)
-        new_positions = [None] * n_verts
-        per_vertex_matrices = [None] * n_verts
 
-        for vi, vert in enumerate(mesh.vertices):
-            # Gather bone weights for this vertex
-            weighted_mat = Matrix.Identity(4) * 0  # zero matrix
-            total_weight = 0.0
+# Rest-pose inverses per armature, reused while the rest pose is unchanged:
+# armature data pointer -> (rest matrix bytes, (n_bones, 4, 4) inverses)
+_REST_INV_CACHE = {}
 
-            for g in vert.groups:
-                vg = child.vertex_groups[g.group]
-                bt = bone_transforms.get(vg.name)
-                if bt is None:
-                    continue
-                w = g.weight
-                if w < 0.0001:
-                    continue
-                for r in range(4):
-                    for c in range(4):
-                        weighted_mat[r][c] += bt[r][c] * w
-                total_weight += w
-
-            if total_weight < 0.0001:
-                # No valid bone weights — keep original position
-                new_positions[vi] = vert.co.copy()
-                per_vertex_matrices[vi] = Matrix.Identity(4)
+
+def _rest_inverses(armature):
+    """Inverses of every bone.matrix_local, in armature.bones order.
+
+    Keyed on the rest matrices themselves, so a rest-pose change (e.g.
+    armature_apply between repose passes) invalidates the entry
+    without any bookkeeping. Singular rest matrices invert to identity.
+    """
+    bones = armature.bones
+    rest = np.empty(len(bones) * 16, dtype=np.float32)
+    bones.foreach_get("matrix_local", rest)
+    stamp = rest.tobytes()
+
+    key = armature.as_pointer()
+    cached = _REST_INV_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    # foreach_get flattens matrices column-major
+    rest = rest.reshape(-1, 4, 4).transpose(0, 2, 1).astype(np.float64)
+    try:
+        rest_inv = np.linalg.inv(rest)
+    except np.linalg.LinAlgError:
+        rest_inv = np.empty_like(rest)
+        for i, m in enumerate(rest):
+            try:
+                rest_inv[i] = np.linalg.inv(m)
+            except np.linalg.LinAlgError:
+                rest_inv[i] = np.eye(4)
+
+    _REST_INV_CACHE[key] = (stamp, rest_inv)
+    return rest_inv
+
+
+def _bake_pose_numpy(child, bone_index, bone_mats):
+    """Numpy linear-blend skinning of one mesh (and its shape keys).
+
+    Args:
+        child: skinned mesh object.
+        bone_index: bone name -> row of bone_mats.
+        bone_mats: (n_bones, 16) row-major pose @ rest-inverse transforms.
+    """
+    mesh = child.data
+    n_verts = len(mesh.vertices)
+
+    co = np.empty(n_verts * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    co = co.reshape(n_verts, 3).astype(np.float64)
+
+    # Vertex group index -> bone index (-1 = group drives no bone)
+    group_to_bone = np.array(
+        [bone_index.get(vg.name, -1) for vg in child.vertex_groups],
+        dtype=np.int32)
+    indptr, inf_bone, inf_weight = _vertex_weight_csr(mesh, group_to_bone)
+
+    # Weighted blend of bone matrices per vertex, normalized by total weight.
+    # Vertices without valid weights keep their position (identity).
+    # Only the top 3x4 is blended: the bottom row of every bone transform
+    # is (0, 0, 0, 1), and the offsets below need just the 3x3 part.
+    bone_affine = np.ascontiguousarray(bone_mats[:, :12])
+    if _HAS_NUMBA:
+        mats = np.empty((n_verts, 12), dtype=np.float64)
+        new_co = np.empty((n_verts, 3), dtype=np.float64)
+        _lbs_blend_numba(indptr, inf_bone, inf_weight, bone_affine, co,
+                         mats, new_co)
+        mats = mats.reshape(n_verts, 3, 4)
+    else:
+        mats = np.zeros((n_verts, 12), dtype=np.float64)
+        total = np.zeros(n_verts, dtype=np.float64)
+        has_inf = indptr[1:] > indptr[:-1]
+        if has_inf.any():
+            starts = indptr[:-1][has_inf]
+            mats[has_inf] = np.add.reduceat(
+                bone_affine[inf_bone] * inf_weight[:, None], starts, axis=0)
+            total[has_inf] = np.add.reduceat(inf_weight, starts)
+        weighted = total >= 0.0001
+        mats[weighted] /= total[weighted, None]
+        mats[~weighted] = np.identity(4)[:3].ravel()
+        mats = mats.reshape(n_verts, 3, 4)
+
+        co_h = np.hstack((co, np.ones((n_verts, 1))))
+        new_co = np.einsum('vij,vj->vi', mats, co_h)
+
+    # Per-vertex rotation for the shape-key offsets, kept compact: a float32
+    # 3x3 rather than the float64 blend. Not a quaternion — a blended matrix
+    # is generally not orthonormal (it carries the LBS shear/shrink).
+    rot = mats[:, :, :3].astype(np.float32)
+    del mats
+
+    # Write deformed positions to base mesh
+    mesh.vertices.foreach_set("co", new_co.astype(np.float32).ravel())
+
+    # Transform shape key offsets — all keys in one (keys, verts, 3) pass
+    if mesh.shape_keys and mesh.shape_keys.key_blocks:
+        key_blocks = mesh.shape_keys.key_blocks
+        n_keys = len(key_blocks)
+        sk_co = np.empty((n_keys, n_verts * 3), dtype=np.float32)
+        for k, kb in enumerate(key_blocks):
+            kb.data.foreach_get("co", sk_co[k])
+        sk_co = sk_co.reshape(n_keys, n_verts, 3)
+
+        # Rotate every non-basis offset vector by its vertex's weighted
+        # rotation. Zero offsets just follow the new basis. Only (key,
+        # vertex) pairs with a real offset on a vertex whose rotation
+        # differs from identity are rotated — usually few, since posed
+        # bones rarely carry shape-key motion (visemes sit on the face).
+        # Work stays in float32, the precision the keys are stored in.
+        rotating = np.abs(rot - np.identity(3)).reshape(n_verts, 9).max(
+            axis=1) > 1e-5
+        offsets = sk_co[1:] - sk_co[0]
+        still = np.einsum('svi,svi->sv', offsets, offsets) < 1e-10
+        key_idx, vert_idx = np.nonzero(rotating & ~still)
+        offsets[key_idx, vert_idx] = np.einsum(
+            'nij,nj->ni', rot[vert_idx], offsets[key_idx, vert_idx])
+        offsets[still] = 0.0
+
+        # Basis = new deformed positions; other keys = basis + offset
+        sk_co[0] = new_co
+        sk_co[1:] = new_co + offsets
+        for k, kb in enumerate(key_blocks):
+            kb.data.foreach_set("co", sk_co[k].ravel())
+
+
+if _HAS_NUMBA:
+    @njit(parallel=True, fastmath=True)
+    def _lbs_blend_numba(indptr, bone_idx, weight, bone_mats, co, mats, new_co):
+        """Compiled LBS kernel: blend each vertex's bone matrices and deform.
+
+        Same result as the reduceat/einsum path in _bake_pose_numpy, but
+        the matrices are tiny, so one fused loop beats numpy's per-call
+        dispatch. bone_mats holds (n_bones, 12) row-major top 3x4s; fills
+        mats (n_verts, 12) and new_co (n_verts, 3). Each vertex accumulates
+        straight into its mats row, so the loop allocates nothing.
+        """
+        for vi in prange(len(indptr) - 1):
+            for j in range(12):
+                mats[vi, j] = 0.0
+            total = 0.0
+            for k in range(indptr[vi], indptr[vi + 1]):
+                w = weight[k]
+                b = bone_idx[k]
+                for j in range(12):
+                    mats[vi, j] += bone_mats[b, j] * w
+                total += w
+            if total >= 0.0001:
+                for j in range(12):
+                    mats[vi, j] /= total
+            else:
+                for j in range(12):
+                    mats[vi, j] = 1.0 if j % 5 == 0 else 0.0
+            x = co[vi, 0]
+            y = co[vi, 1]
+            z = co[vi, 2]
+            for r in range(3):
+                new_co[vi, r] = (mats[vi, 4 * r] * x
+                                 + mats[vi, 4 * r + 1] * y
+                                 + mats[vi, 4 * r + 2] * z
+                                 + mats[vi, 4 * r + 3])
+
+
+def _vertex_weight_csr(mesh, group_to_bone):
+    """Gather a mesh's bone influences as CSR arrays (numpy path).
+
+    Args:
+        mesh: Blender mesh data.
+        group_to_bone: int32 array mapping vertex group index -> bone index
+            (-1 for groups that drive no bone).
+
+    Returns:
+        (indptr, bone_idx, weight): vertex vi owns entries
+        indptr[vi]:indptr[vi + 1]. Entries for non-bone groups and weights
+        below 0.0001 are dropped.
+    """
+    import bmesh
+
+    n_verts = len(mesh.vertices)
+    counts = np.zeros(n_verts, dtype=np.int64)
+    pairs = []
+
+    # Read weights through a BMesh deform layer: one items() call per
+    # vertex instead of an RNA VertexGroupElement per influence.
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(mesh)
+        deform = bm.verts.layers.deform.active
+        if deform is not None:
+            for vi, vert in enumerate(bm.verts):
+                items = vert[deform].items()
+                counts[vi] = len(items)
+                pairs.extend(items)
+    finally:
+        bm.free()
+
+    n_inf = len(pairs)
+    group_idx = np.empty(n_inf, dtype=np.int32)
+    weight = np.empty(n_inf, dtype=np.float64)
+    if n_inf:
+        pairs = np.array(pairs, dtype=np.float64)
+        group_idx[:] = pairs[:, 0]
+        weight[:] = pairs[:, 1]
+
+    bone_idx = group_to_bone[group_idx]
+    keep = (bone_idx >= 0) & (weight >= 0.0001)
+
+    # Re-count surviving entries per vertex (entries stay vertex-ordered)
+    owner = np.repeat(np.arange(n_verts), counts)[keep]
+    indptr = np.zeros(n_verts + 1, dtype=np.int64)
+    np.cumsum(np.bincount(owner, minlength=n_verts), out=indptr[1:])
+    return indptr, bone_idx[keep], weight[keep]
+
+
+def _bake_pose_python(child, bone_transforms):
+    """Per-vertex mathutils fallback for _bake_pose_numpy.
+
+    Args:
+        child: skinned mesh object.
+        bone_transforms: bone name -> pose @ rest-inverse Matrix.
+    """
+    from mathutils import Matrix, Vector
+
+    mesh = child.data
+    n_verts = len(mesh.vertices)
+
+    # Precompute per-vertex weighted rotation (for shape key offsets)
+    # and deformed positions (for base mesh)
+    new_positions = [None] * n_verts
+    per_vertex_matrices = [None] * n_verts
+    zero_mat = Matrix.Identity(4) * 0
+
+    # Vertex group index -> bone transform (None = group drives no bone),
+    # so influences index a list instead of hashing bone names
+    group_transforms = [bone_transforms.get(vg.name)
+                        for vg in child.vertex_groups]
+
+    for vi, vert in enumerate(mesh.vertices):
+        # Gather bone weights for this vertex (whole-matrix mathutils
+        # arithmetic — one C call per influence instead of 16 cell writes)
+        weighted_mat = zero_mat.copy()
+        total_weight = 0.0
+
+        for g in vert.groups:
+            bt = group_transforms[g.group]
+            if bt is None:
+                continue
+            w = g.weight
+            if w < 0.0001:
                 continue
+            weighted_mat += bt * w
+            total_weight += w
+
+        if total_weight < 0.0001:
+            # No valid bone weights — keep original position
+            new_positions[vi] = vert.co.copy()
+            per_vertex_matrices[vi] = Matrix.Identity(4)
+            continue
 
-            # Normalize
-            for r in range(4):
-                for c in range(4):
-                    weighted_mat[r][c] /= total_weight
+        # Normalize
+        weighted_mat *= 1.0 / total_weight
 
-            per_vertex_matrices[vi] = weighted_mat
-            new_positions[vi] = weighted_mat @ vert.co
+        per_vertex_matrices[vi] = weighted_mat
+        new_positions[vi] = weighted_mat @ vert.co
 
-        # Write deformed positions to base mesh
+    # Write deformed positions to base mesh
+    for vi, pos in enumerate(new_positions):
+        if pos is not None:
+            mesh.vertices[vi].co = pos
+
+    # Transform shape key offsets
+    if mesh.shape_keys and mesh.shape_keys.key_blocks:
+        basis = mesh.shape_keys.key_blocks[0]
+        basis_coords = [Vector(v.co) for v in basis.data]
+
+        # Update basis to match new deformed positions
         for vi, pos in enumerate(new_positions):
             if pos is not None:
-                mesh.vertices[vi].co = pos
-
-        # Transform shape key offsets
-        if mesh.shape_keys and mesh.shape_keys.key_blocks:
-            basis = mesh.shape_keys.key_blocks[0]
-            basis_coords = [Vector(v.co) for v in basis.data]
-
-            # Update basis to match new deformed positions
-            for vi, pos in enumerate(new_positions):
-                if pos is not None:
-                    basis.data[vi].co = pos
-
-            # For each non-basis shape key, rotate the offset vector
-            for sk in mesh.shape_keys.key_blocks[1:]:
-                for vi in range(n_verts):
-                    original_offset = Vector(sk.data[vi].co) - basis_coords[vi]
-                    if original_offset.length < 0.00001:
-                        # Zero offset — just update to new basis
-                        sk.data[vi].co = new_positions[vi]
-                        continue
-
-                    # Rotate the offset by the per-vertex weighted rotation
-                    mat = per_vertex_matrices[vi]
-                    rot_mat = mat.to_3x3()
-                    rotated_offset = rot_mat @ original_offset
-                    sk.data[vi].co = new_positions[vi] + rotated_offset
+                basis.data[vi].co = pos
+
+        # For each non-basis shape key, rotate the offset vector
+        for sk in mesh.shape_keys.key_blocks[1:]:
+            for vi in range(n_verts):
+                original_offset = Vector(sk.data[vi].co) - basis_coords[vi]
+                if original_offset.length < 0.00001:
+                    # Zero offset — just update to new basis
+                    sk.data[vi].co = new_positions[vi]
+                    continue
 
-        mesh.update()
+                # Rotate the offset by the per-vertex weighted rotation
+                mat = per_vertex_matrices[vi]
+                rot_mat = mat.to_3x3()
+                rotated_offset = rot_mat @ original_offset
+                sk.data[vi].co = new_positions[vi] + rotated_offset
 
 
 # ============================================================================
@@ -2303,7 +2828,6 @@ def _pose_match_native_bind(armature_obj, target_game='XML2'):
     Models already in clean T-pose see near-zero rotations (no-op).
     """
     import bpy
-    import math
     from mathutils import Matrix, Quaternion, Vector
 
     # Native joint positions in armature space (directions only — overall
@@ -2405,7 +2929,6 @@ def _align_thumbs_to_native(armature_obj, target_game='XML2'):
     rig or a manually fixed model).
     """
     import bpy
-    import math
     from mathutils import Matrix, Quaternion, Vector
 
     arm_rot = armature_obj.matrix_world.to_quaternion().to_matrix()
@@ -2476,8 +2999,9 @@ def _align_thumbs_to_native(armature_obj, target_game='XML2'):
         if R.to_quaternion().angle < 0.002:
             continue
         head = pbs['Finger0'].matrix.translation.copy()
-        pivot = (Matrix.Translation(head) @ R.to_4x4()
-                 @ Matrix.Translation(-head))
+        # Rotate about the thumb head: T(head) @ R @ T(-head), built in one
+        # constructor call.
+        pivot = Matrix.LocRotScale(head - R @ head, R, None)
         pbs['Finger0'].matrix = pivot @ pbs['Finger0'].matrix
         bpy.context.view_layer.update()
         rotated += 1
@@ -2578,7 +3102,7 @@ def convert_rig(armature_obj, profile='AUTO', auto_scale=True, target_height=68.
     if profile == 'AUTO':
         detected = detect_rig_profile(armature_obj)
         if detected is None:
-            bone_names = [b.name for b in armature_obj.data.bones[:10]]
+            bone_names = armature_obj.data.bones.keys()[:10]
             return {'success': False,
                     'error': f"Could not detect rig type. Bones: {', '.join(bone_names)}... "
                              "Try running CATS 'Fix Model' first.",
@@ -2624,7 +3148,7 @@ def convert_rig(armature_obj, profile='AUTO', auto_scale=True, target_height=68.
         print(f"    -> {tgt}:  {', '.join(sorted(by_target[tgt]))}")
 
     if not rename_map:
-        bone_names = [b.name for b in armature_obj.data.bones[:10]]
+        bone_names = armature_obj.data.bones.keys()[:10]
         return {'success': False,
                 'error': f"No bones matched any known convention. "
                          f"Bones: {', '.join(bone_names)}...",
@@ -2654,19 +3178,15 @@ def convert_rig(armature_obj, profile='AUTO', auto_scale=True, target_height=68.
     _merge_vertex_weights(armature_obj, merge_map, reverse_rename)
 
     # ---- 4. Rename vertex groups on all child meshes BEFORE bone rename ----
-    # (vertex groups reference bones by name)
-    _rename_vertex_groups(armature_obj, rename_map)
-
-    # Also remove vertex groups for bones being deleted (not in rename or merge)
+    # (vertex groups reference bones by name), and remove the groups of
+    # bones being deleted (not in rename or merge) in the same pass
     target_skeleton = get_skeleton_for_game(target_game,
                                             full_fingers=full_fingers)
-    all_target_names = {entry[0] for entry in target_skeleton if entry[0]}
-    bones_to_remove = set()
-    for bone in armature_obj.data.bones:
-        if bone.name not in rename_map:
-            bones_to_remove.add(bone.name)
+    all_target_names = get_bone_names_for_game(target_game,
+                                               full_fingers=full_fingers)
+    bones_to_remove = set(armature_obj.data.bones.keys()) - rename_map.keys()
 
-    _remove_vertex_groups(armature_obj, bones_to_remove)
+    _rename_and_remove_vertex_groups(armature_obj, rename_map, bones_to_remove)
 
     # ---- 5. Enter edit mode: rename, remove, create bones ----
     # Ensure armature is active and selected
@@ -2686,142 +3206,44 @@ def convert_rig(armature_obj, profile='AUTO', auto_scale=True, target_height=68.
     for eb in edit_bones:
         eb.use_connect = False
 
-    # Rename mapped bones
+    # Name -> EditBone for the rest of this edit session; kept in sync as
+    # bones are renamed, removed and created, so no RNA .get() lookups or
+    # re-walks of edit_bones are needed.
+    eb_by_name = {eb.name: eb for eb in edit_bones}
+
+    # Rename mapped bones (re-keyed by the name Blender actually assigned —
+    # it uniquifies on collision with a bone not yet renamed)
     for old_name, new_name in rename_map.items():
-        eb = edit_bones.get(old_name)
+        eb = eb_by_name.pop(old_name, None)
         if eb:
             eb.name = new_name
+            eb_by_name[eb.name] = eb
             mapped_count += 1
 
     # Remove unmapped bones (those not renamed to a target skeleton name)
-    current_names = {eb.name for eb in edit_bones}
-    bones_to_delete = []
-    for eb in edit_bones:
-        if eb.name not in all_target_names and eb.name not in {"", "Bone_000"}:
-            bones_to_delete.append(eb.name)
-
+    bones_to_delete = eb_by_name.keys() - all_target_names - {"", "Bone_000"}
     for name in bones_to_delete:
-        eb = edit_bones.get(name)
-        if eb:
-            edit_bones.remove(eb)
-            removed_count += 1
+        edit_bones.remove(eb_by_name.pop(name))
+        removed_count += 1
 
     # ---- 6. Create missing target skeleton bones ----
-    added_count = 0
-    current_names = {eb.name for eb in edit_bones}
-
-    # Build parent name lookup from target skeleton
-    skel_by_name = {}
-    for name, idx, parent_idx, bm_idx, flags in target_skeleton:
-        parent_name = target_skeleton[parent_idx][0] if parent_idx >= 0 else None
-        skel_by_name[name] = (idx, parent_idx, parent_name, bm_idx, flags)
-
     # Helper: compute a small bone length based on existing bones
-    bone_lengths = [eb.length for eb in edit_bones if eb.length > 0.001]
-    avg_bone_len = sum(bone_lengths) / len(bone_lengths) if bone_lengths else 0.05
-
-    # Process in index order so parents are created before children
-    for name, idx, parent_idx, bm_idx, flags in target_skeleton:
-        if not name:
-            display_name = "Bone_000"
-        else:
-            display_name = name
-
-        if display_name in current_names:
-            continue  # Already exists (was renamed from source bone)
-
-        # Create the bone
-        eb = edit_bones.new(display_name)
-        small_len = avg_bone_len * 0.3  # dummy bones are small
-
-        # Find parent bone
-        if parent_idx >= 0:
-            parent_bone_name = target_skeleton[parent_idx][0]
-            if not parent_bone_name:
-                parent_bone_name = "Bone_000"
-            parent_eb = edit_bones.get(parent_bone_name)
-            if parent_eb:
-                eb.parent = parent_eb
-
-                # Smart placement: place dummy at parent's TAIL (end)
-                # so it chains naturally after existing bones
-                eb.head = parent_eb.tail.copy()
-
-                # Special cases for better visual placement
-                finger_placed = False
-                if name == "Bip01 Spine2":
-                    # UpperChest: place between Chest (Spine1) and Neck
-                    neck_eb = edit_bones.get("Bip01 Neck")
-                    if neck_eb:
-                        # Midpoint between parent tail and neck head
-                        eb.head = (parent_eb.tail + neck_eb.head) * 0.5
-                    # else stays at parent tail
-                elif name.startswith("Bip01 Ponytail"):
-                    # Ponytails: place behind head, extending upward
-                    head_eb = edit_bones.get("Bip01 Head")
-                    if head_eb:
-                        eb.head = head_eb.tail.copy()
-                        if name == "Bip01 Ponytail11":
-                            # Second ponytail extends further
-                            pony1 = edit_bones.get("Bip01 Ponytail1")
-                            if pony1:
-                                eb.head = pony1.tail.copy()
-                elif " Finger" in name:
-                    # Fingers: anchor to the hand bone using native XML2
-                    # proportions (hand tail can point anywhere on imports)
-                    finger_placed = _place_missing_finger(eb, name, edit_bones)
-                elif name == "" or name == "Bip01":
-                    # Root/Bip01: at origin
-                    eb.head = Vector((0, 0, 0))
-                elif name == "Motion":
-                    # Motion: at origin
-                    eb.head = Vector((0, 0, 0))
-
-                if not finger_placed:
-                    # Compute tail: extend in same direction as parent
-                    parent_dir = (parent_eb.tail - parent_eb.head)
-                    if parent_dir.length > 0.001:
-                        eb.tail = eb.head + parent_dir.normalized() * small_len
-                    else:
-                        eb.tail = eb.head + Vector((0, small_len, 0))
-            else:
-                eb.head = Vector((0, 0, 0))
-                eb.tail = Vector((0, small_len, 0))
-        else:
-            # Root bone (no parent)
-            eb.head = Vector((0, 0, 0))
-            eb.tail = Vector((0, small_len, 0))
-
-        eb.use_connect = False
-        added_count += 1
-        current_names.add(display_name)
+    avg_bone_len = _avg_bone_length(edit_bones)
 
-    # Fix parent relationships for ALL target skeleton bones (some renamed
-    # ones may need re-parenting to match the target hierarchy)
-    for name, idx, parent_idx, bm_idx, flags in target_skeleton:
-        display_name = name if name else "Bone_000"
-        eb = edit_bones.get(display_name)
-        if not eb:
-            continue
-
-        if parent_idx >= 0:
-            parent_name = target_skeleton[parent_idx][0]
-            parent_display = parent_name if parent_name else "Bone_000"
-            parent_eb = edit_bones.get(parent_display)
-            if parent_eb and eb.parent != parent_eb:
-                eb.parent = parent_eb
+    added_count = len(_create_missing_skeleton_bones(
+        edit_bones, eb_by_name, target_skeleton, avg_bone_len))
 
     # ---- 7. Position non-deforming structural bones ----
     # Bip01 must be co-located with Pelvis (native XML2 convention).
     # This ensures correct FK pivot for animations and proper head/optic
     # beam placement.  Motion bone anchors at ground level for walk cycles.
-    pelvis_eb = edit_bones.get("Bip01 Pelvis")
-    bip01_eb = edit_bones.get("Bip01")
+    pelvis_eb = eb_by_name.get("Bip01 Pelvis")
+    bip01_eb = eb_by_name.get("Bip01")
     if pelvis_eb and bip01_eb:
         bip01_eb.head = pelvis_eb.head.copy()
         bip01_eb.tail = bip01_eb.head + Vector((0, 0, avg_bone_len * 0.3))
 
-    motion_eb = edit_bones.get("Motion")
+    motion_eb = eb_by_name.get("Motion")
     if motion_eb and pelvis_eb:
         motion_eb.head = Vector((pelvis_eb.head.x, pelvis_eb.head.y, 0.0))
         motion_eb.tail = motion_eb.head + Vector((0, avg_bone_len * 0.3, 0))
@@ -2857,18 +3279,10 @@ def convert_rig(armature_obj, profile='AUTO', auto_scale=True, target_height=68.
     # with curled or spread bind poses. Near no-op for clean T-poses.
     # A-pose target (or align_pose off): legacy arm-elevation repose only.
     if target_pose == 'KEEP_POSE':
-        # Don't repose — but DO disconnect bones, like every other pose
-        # path. Connected bones lock their head to the parent's tail, so
-        # the later bone-display tail update (and translation computation)
-        # would drag connected children and corrupt the skeleton. Pure
-        # connection toggle: bone positions are unchanged.
-        import bpy
-        bpy.context.view_layer.objects.active = armature_obj
-        armature_obj.select_set(True)
-        bpy.ops.object.mode_set(mode='EDIT')
-        for eb in armature_obj.data.edit_bones:
-            eb.use_connect = False
-        bpy.ops.object.mode_set(mode='OBJECT')
+        # Don't repose. Bones must still be disconnected (connected heads
+        # lock to the parent's tail, so the later bone-display tail update
+        # would drag children) — step 5 already did that for every bone,
+        # including the created ones, so no extra edit session is needed.
         print("[IGB Rig Converter] Keep Current Pose: no reposing, no "
               "native-biped fit — exporting the model's imported pose as-is")
     elif target_pose == 'T_POSE' and align_pose:
@@ -2911,10 +3325,13 @@ def convert_rig(armature_obj, profile='AUTO', auto_scale=True, target_height=68.
     # T-pose target: use hardcoded NATIVE_BONE_ROTATIONS (animation compat)
     # A-pose target: compute rotations from actual bone orientations
     use_native = (target_pose == 'T_POSE')
-    inv_matrices = _compute_inv_joint_matrices(armature_obj, use_native)
+    binds = _precompute_binds(armature_obj, use_native)
+    inv_matrices = _compute_inv_joint_matrices(armature_obj, use_native,
+                                               binds=binds)
 
     # ---- 9. Compute bone translations ----
-    translations = _compute_bone_translations(armature_obj, use_native)
+    translations = _compute_bone_translations(armature_obj, use_native,
+                                              binds=binds)
 
     # ---- 9b. Force non-deforming root bones to native translations ----
     # Bip01 Z must be exactly ~41.82 game units for correct menu placement,
@@ -3005,109 +3422,46 @@ def setup_bip01_rig(armature_obj, auto_scale=True, target_height=68.0,
     bpy.ops.object.mode_set(mode='EDIT')
 
     edit_bones = armature_obj.data.edit_bones
-    added_count = 0
-    newly_created = set()  # Track which bones we create (vs already existed)
 
     # Disconnect all bones (XML2 bones are never connected)
     for eb in edit_bones:
         eb.use_connect = False
 
+    # Name -> EditBone for this edit session, updated as bones are created
+    eb_by_name = {eb.name: eb for eb in edit_bones}
+
     # Compute a reference bone length for dummies
-    bone_lengths = [eb.length for eb in edit_bones if eb.length > 0.001]
-    avg_bone_len = (sum(bone_lengths) / len(bone_lengths)
-                    if bone_lengths else 0.05)
+    avg_bone_len = _avg_bone_length(edit_bones)
 
     # Create missing target skeleton bones (XML2 or MUA; full-finger variant
     # when the conversion flagged it on the armature)
     skeleton = get_skeleton_for_game(
         target_game, full_fingers=armature_obj.get('igb_full_fingers', False))
-    current_names = {eb.name for eb in edit_bones}
-    for name, idx, parent_idx, bm_idx, flags in skeleton:
-        display_name = name if name else "Bone_000"
-        if display_name in current_names:
-            continue
-
-        eb = edit_bones.new(display_name)
-        small_len = avg_bone_len * 0.3
-
-        if parent_idx >= 0:
-            parent_bone_name = skeleton[parent_idx][0]
-            if not parent_bone_name:
-                parent_bone_name = "Bone_000"
-            parent_eb = edit_bones.get(parent_bone_name)
-            if parent_eb:
-                eb.parent = parent_eb
-                eb.head = parent_eb.tail.copy()
-
-                # Smart placement for common bones
-                finger_placed = False
-                if name == "Bip01 Spine2":
-                    neck_eb = edit_bones.get("Bip01 Neck")
-                    if neck_eb:
-                        eb.head = (parent_eb.tail + neck_eb.head) * 0.5
-                elif name.startswith("Bip01 Ponytail"):
-                    head_eb = edit_bones.get("Bip01 Head")
-                    if head_eb:
-                        eb.head = head_eb.tail.copy()
-                        if name == "Bip01 Ponytail11":
-                            pony1 = edit_bones.get("Bip01 Ponytail1")
-                            if pony1:
-                                eb.head = pony1.tail.copy()
-                elif " Finger" in name:
-                    finger_placed = _place_missing_finger(eb, name, edit_bones)
-
-                if not finger_placed:
-                    parent_dir = parent_eb.tail - parent_eb.head
-                    if parent_dir.length > 0.001:
-                        eb.tail = eb.head + parent_dir.normalized() * small_len
-                    else:
-                        eb.tail = eb.head + Vector((0, small_len, 0))
-            else:
-                eb.head = Vector((0, 0, 0))
-                eb.tail = Vector((0, small_len, 0))
-        else:
-            eb.head = Vector((0, 0, 0))
-            eb.tail = Vector((0, small_len, 0))
-
-        eb.use_connect = False
-        added_count += 1
-        newly_created.add(display_name)
-        current_names.add(display_name)
-
-    # Fix parent hierarchy for ALL target skeleton bones
-    for name, idx, parent_idx, bm_idx, flags in skeleton:
-        display_name = name if name else "Bone_000"
-        eb = edit_bones.get(display_name)
-        if not eb:
-            continue
-        if parent_idx >= 0:
-            parent_name = skeleton[parent_idx][0]
-            parent_display = parent_name if parent_name else "Bone_000"
-            parent_eb = edit_bones.get(parent_display)
-            if parent_eb and eb.parent != parent_eb:
-                eb.parent = parent_eb
+    newly_created = _create_missing_skeleton_bones(
+        edit_bones, eb_by_name, skeleton, avg_bone_len)
+    added_count = len(newly_created)
 
     # Position structural bones — ONLY if they were newly created.
     # Existing bones (Bip01, Motion, Bone_000) are already in the correct
     # position and must NOT be moved.  Bip01 controls the model's facing
     # direction, and Motion / Bone_000 must stay at the origin.
-    pelvis_eb = edit_bones.get("Bip01 Pelvis")
+    pelvis_eb = eb_by_name.get("Bip01 Pelvis")
 
     if "Bip01" in newly_created:
-        bip01_eb = edit_bones.get("Bip01")
+        bip01_eb = eb_by_name.get("Bip01")
         if pelvis_eb and bip01_eb:
             bip01_eb.head = pelvis_eb.head.copy()
             bip01_eb.tail = (bip01_eb.head
                              + Vector((0, 0, avg_bone_len * 0.3)))
 
     if "Motion" in newly_created:
-        motion_eb = edit_bones.get("Motion")
+        motion_eb = eb_by_name.get("Motion")
         if motion_eb:
             motion_eb.head = Vector((0, 0, 0))
             motion_eb.tail = Vector((0, avg_bone_len * 0.3, 0))
 
     if "Bone_000" in newly_created:
-        bone000_eb = edit_bones.get("Bone_000")
+        bone000_eb = eb_by_name.get("Bone_000")
         if bone000_eb:
             bone000_eb.head = Vector((0, 0, 0))
             bone000_eb.tail = Vector((0, avg_bone_len * 0.3, 0))
@@ -3118,8 +3472,11 @@ def setup_bip01_rig(armature_obj, auto_scale=True, target_height=68.0,
     # Always use native T-pose rotations (NATIVE_BONE_ROTATIONS) since
     # existing Bip01 rigs are expected to be in T-pose orientation.
     use_native = True
-    inv_matrices = _compute_inv_joint_matrices(armature_obj, use_native)
-    translations = _compute_bone_translations(armature_obj, use_native)
+    binds = _precompute_binds(armature_obj, use_native)
+    inv_matrices = _compute_inv_joint_matrices(armature_obj, use_native,
+                                               binds=binds)
+    translations = _compute_bone_translations(armature_obj, use_native,
+                                              binds=binds)
 
     _force_native_root_translations(translations,
                                     _total_export_scale(armature_obj))
@@ -3172,11 +3529,8 @@ def validate_bip01_rig(armature_obj):
     bones = armature_obj.data.bones
 
     # 1. Missing bones
-    missing = []
-    for name, idx, parent_idx, bm_idx, flags in XML2_SKELETON:
-        display_name = name if name else "Bone_000"
-        if display_name not in bones:
-            missing.append(display_name)
+    missing = [display_name for display_name in _XML2_DISPLAY_NAMES
+               if display_name not in bones]
     if missing:
         if len(missing) <= 3:
             issues.append(('ERROR', f"Missing bones: {', '.join(missing)}"))
@@ -3187,15 +3541,12 @@ def validate_bip01_rig(armature_obj):
 
     # 2. Wrong parent hierarchy
     hierarchy_fixes = 0
-    for name, idx, parent_idx, bm_idx, flags in XML2_SKELETON:
-        display_name = name if name else "Bone_000"
+    for display_name, expected_parent in zip(_XML2_DISPLAY_NAMES,
+                                             _XML2_PARENT_DISPLAY):
         bone = bones.get(display_name)
         if bone is None:
             continue
-        if parent_idx >= 0:
-            expected_parent = XML2_SKELETON[parent_idx][0]
-            if not expected_parent:
-                expected_parent = "Bone_000"
+        if expected_parent is not None:
             actual_parent = bone.parent.name if bone.parent else None
             if actual_parent != expected_parent:
                 hierarchy_fixes += 1
@@ -3233,8 +3584,7 @@ def validate_bip01_rig(armature_obj):
 
     # 6. Missing per-bone metadata
     missing_meta = 0
-    for name, idx, parent_idx, bm_idx, flags in XML2_SKELETON:
-        display_name = name if name else "Bone_000"
+    for display_name in _XML2_DISPLAY_NAMES:
         if display_name in armature_obj.pose.bones:
             pb = armature_obj.pose.bones[display_name]
             if "igb_bone_index" not in pb:
@@ -3294,22 +3644,68 @@ def _get_skinned_meshes(armature_obj):
     return meshes
 
 
-def _rename_vertex_groups(armature_obj, rename_map):
-    """Rename vertex groups on all skinned meshes according to rename_map."""
-    for child in _get_skinned_meshes(armature_obj):
-        for vg in child.vertex_groups:
-            if vg.name in rename_map:
-                vg.name = rename_map[vg.name]
-
+def _rename_and_remove_vertex_groups(armature_obj, rename_map,
+                                     bone_names_to_remove):
+    """Rename vertex groups per rename_map, then drop deleted bones' groups.
 
-def _remove_vertex_groups(armature_obj, bone_names_to_remove):
-    """Remove vertex groups for deleted bones on all skinned meshes."""
+    One walk of the skinned meshes and of each mesh's groups. Removal is
+    decided on the post-rename name, as when renaming ran first as its own
+    pass.
+    """
     for child in _get_skinned_meshes(armature_obj):
-        to_remove = [vg for vg in child.vertex_groups if vg.name in bone_names_to_remove]
+        to_remove = []
+        for vg in child.vertex_groups:
+            new_name = rename_map.get(vg.name)
+            if new_name is not None:
+                vg.name = new_name
+            if vg.name in bone_names_to_remove:
+                to_remove.append(vg)
         for vg in to_remove:
             child.vertex_groups.remove(vg)
 
 
+def _gather_merged_weights(mesh, src_index_to_target):
+    """Sum a mesh's merge-source weights per (target group, vertex).
+
+    Read-only: the caller applies the result with VertexGroup.add. One pass
+    over all vertices — O(verts x groups) rather than O(sources x verts) —
+    reading weights through a BMesh deform layer (one items() call per
+    vertex instead of an RNA VertexGroupElement per influence).
+
+    Args:
+        mesh: Blender mesh data.
+        src_index_to_target: source vertex group index -> target group name.
+
+    Returns:
+        Dict target name -> {merged weight: [vertex indices]}. Grouped by
+        weight because VertexGroup.add takes one weight per index list
+        (rigid and fully-painted regions share a handful of values).
+    """
+    import bmesh
+
+    pending = {}  # target vg name -> {vert_index: weight}
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(mesh)
+        deform = bm.verts.layers.deform.active
+        if deform is not None:
+            for vi, vert in enumerate(bm.verts):
+                for group, weight in vert[deform].items():
+                    target_name = src_index_to_target.get(group)
+                    if target_name is not None and weight > 0.0:
+                        bucket = pending.setdefault(target_name, {})
+                        bucket[vi] = bucket.get(vi, 0.0) + weight
+    finally:
+        bm.free()
+
+    merged = {}
+    for target_name, vert_weights in pending.items():
+        by_weight = merged[target_name] = {}
+        for vert_index, weight in vert_weights.items():
+            by_weight.setdefault(weight, []).append(vert_index)
+    return merged
+
+
 def _merge_vertex_weights(armature_obj, merge_map, reverse_rename=None):
     """Merge vertex weights from extra bones into their target bones.
 
@@ -3325,8 +3721,6 @@ def _merge_vertex_weights(armature_obj, merge_map, reverse_rename=None):
         merge_map: Dict mapping source_bone_name -> target_xml2_name.
         reverse_rename: Dict mapping xml2_name -> current_bone_name (optional).
     """
-    import bpy
-
     if not merge_map:
         return
     if reverse_rename is None:
@@ -3335,50 +3729,57 @@ def _merge_vertex_weights(armature_obj, merge_map, reverse_rename=None):
     for child in _get_skinned_meshes(armature_obj):
         mesh = child.data
 
+        # Name -> index of the mesh's groups, read in one walk. Indices stay
+        # valid here: groups are only appended until the removals at the end.
+        group_index = {vg.name: vg.index for vg in child.vertex_groups}
+        relevant = [(src_name, xml2_target)
+                    for src_name, xml2_target in merge_map.items()
+                    if src_name in group_index]
+        if not relevant:
+            continue  # no merge source on this mesh (eyes, accessories...)
+
         # Resolve all source groups -> target group NAMES up front, creating
-        # missing target groups. Names (not references/indices) are tracked
-        # because vertex_groups.new() can reallocate the collection.
+        # missing target groups. Names (not references) are tracked because
+        # vertex_groups.new() can reallocate the collection.
         src_index_to_target = {}   # src vg index -> target vg name
         source_group_names = []
-        for src_name, xml2_target in merge_map.items():
-            src_vg = child.vertex_groups.get(src_name)
-            if src_vg is None:
-                continue
+        for src_name, xml2_target in relevant:
+            src_idx = group_index[src_name]
 
             # Resolve XML2 target name to the CURRENT vertex group name.
             # e.g., "Bip01 L Finger1" -> "MiddleFinger1_L" (pre-rename name)
             current_target_name = reverse_rename.get(xml2_target, xml2_target)
 
-            target_vg = child.vertex_groups.get(current_target_name)
-            if target_vg is None:
-                target_vg = child.vertex_groups.get(xml2_target)
-            if target_vg is None:
+            if current_target_name in group_index:
+                target_name = current_target_name
+            elif xml2_target in group_index:
+                target_name = xml2_target
+            else:
                 # Create with the CURRENT name so rename step works later
                 target_vg = child.vertex_groups.new(name=current_target_name)
+                target_name = target_vg.name
+                group_index[target_name] = target_vg.index
+            if target_name == src_name:
+                # Identity merge: the source already IS the target group.
+                # Adding it to itself would double the weights, and removing
+                # the "source" afterwards would then drop them entirely.
+                continue
 
-            src_index_to_target[child.vertex_groups[src_name].index] = target_vg.name
+            src_index_to_target[src_idx] = target_name
             source_group_names.append(src_name)
 
         if not src_index_to_target:
             continue
 
-        # Single pass over all vertices: accumulate merged weight per
-        # (target, vertex). O(verts x groups) instead of O(sources x verts).
-        pending = {}  # target vg name -> {vert_index: weight}
-        for vert in mesh.vertices:
-            for g in vert.groups:
-                target_name = src_index_to_target.get(g.group)
-                if target_name is not None and g.weight > 0.0:
-                    bucket = pending.setdefault(target_name, {})
-                    bucket[vert.index] = bucket.get(vert.index, 0.0) + g.weight
-
-        for target_name, vert_weights in pending.items():
+        # Read side first (no RNA writes), then apply on the groups
+        for target_name, by_weight in _gather_merged_weights(
+                mesh, src_index_to_target).items():
             target_vg = child.vertex_groups.get(target_name)
             if target_vg is None:
                 continue
-            for vert_index, weight in vert_weights.items():
+            for weight, vert_indices in by_weight.items():
                 try:
-                    target_vg.add([vert_index], weight, 'ADD')
+                    target_vg.add(vert_indices, weight, 'ADD')
                 except Exception:
                     pass
 
@@ -3409,10 +3810,41 @@ def _update_bone_display(armature_obj):
     already stored as custom properties and is not affected by tail changes.
     """
     import bpy
-    import math
-    from mathutils import Quaternion, Vector
+    from mathutils import Vector
+
+    native_axes = _native_display_axes()
 
-    rz90_inv = Quaternion((0, 0, 1), math.radians(-90))
+    # Compute a fallback bone length from the armature's Z extent. Read from
+    # the rest bones before entering edit mode — same heads as the edit
+    # bones, but foreach_get-able.
+    bones = armature_obj.data.bones
+    n = len(bones)
+    heads = None
+    if not n:
+        armature_height = 0.1
+    elif _HAS_NUMPY:
+        heads = np.empty(n * 3, dtype=np.float32)
+        bones.foreach_get("head_local", heads)
+        head_z = heads[2::3]
+        armature_height = max(float(head_z.max() - head_z.min()), 0.1)
+    else:
+        head_z = [b.head_local.z for b in bones]
+        armature_height = max(max(head_z) - min(head_z), 0.1)
+    default_bone_len = armature_height * 0.03  # ~3% of height
+
+    up = Vector((0, 0, 1))
+
+    if heads is not None:
+        # Tails depend only on heads, so they can be computed from the rest
+        # bones. Re-converting an already-converted rig usually yields the
+        # tails it has — skip the edit-mode round trip then.
+        tails = _display_tails_numpy(
+            [b.name for b in bones], heads.reshape(n, 3).astype(np.float64),
+            native_axes, up, default_bone_len).astype(np.float32).ravel()
+        cur_tails = np.empty(n * 3, dtype=np.float32)
+        bones.foreach_get("tail_local", cur_tails)
+        if np.allclose(tails, cur_tails, atol=1e-4):
+            return
 
     bpy.context.view_layer.objects.active = armature_obj
     armature_obj.select_set(True)
@@ -3420,59 +3852,70 @@ def _update_bone_display(armature_obj):
 
     edit_bones = armature_obj.data.edit_bones
 
-    # Build XML2 parent->children map for natural bone length computation
-    xml2_children = {}  # parent_name -> [child_name, ...]
-    for name, idx, parent_idx, bm_idx, flags in XML2_SKELETON:
-        if parent_idx >= 0:
-            parent_name = XML2_SKELETON[parent_idx][0]
-            parent_display = parent_name if parent_name else "Bone_000"
-            display_name = name if name else "Bone_000"
-            xml2_children.setdefault(parent_display, []).append(display_name)
+    if heads is not None:
+        # Edit bones share data.bones' order, so the tails map one-to-one.
+        edit_bones.foreach_set("tail", tails)
+        bpy.ops.object.mode_set(mode='OBJECT')
+        return
 
-    # Compute a fallback bone length from the armature's Z extent
-    min_z = float('inf')
-    max_z = float('-inf')
-    for eb in edit_bones:
-        min_z = min(min_z, eb.head.z)
-        max_z = max(max_z, eb.head.z)
-    armature_height = max(max_z - min_z, 0.1)
-    default_bone_len = armature_height * 0.03  # ~3% of height
+    # Heads are read once (each eb.head access wraps a new Vector); only
+    # tails change below, so they stay valid for the child distances.
+    heads = {eb.name: eb.head.copy() for eb in edit_bones}
 
     for eb in edit_bones:
+        head = heads[eb.name]
+
         # Compute bone length from distance to nearest child
-        children = xml2_children.get(eb.name, [])
         bone_len = 0.0
-        if children:
-            min_child_dist = float('inf')
-            for child_name in children:
-                child_eb = edit_bones.get(child_name)
-                if child_eb:
-                    dist = (child_eb.head - eb.head).length
-                    if dist > 0.001:
-                        min_child_dist = min(min_child_dist, dist)
-            if min_child_dist < float('inf'):
-                bone_len = min_child_dist * 0.8  # 80% of distance to child
+        min_child_dist = float('inf')
+        for child_name in _XML2_CHILDREN.get(eb.name, ()):
+            child_head = heads.get(child_name)
+            if child_head is not None:
+                dist = (child_head - head).length
+                if dist > 0.001:
+                    min_child_dist = min(min_child_dist, dist)
+        if min_child_dist < float('inf'):
+            bone_len = min_child_dist * 0.8  # 80% of distance to child
 
         if bone_len < 0.001:
             bone_len = default_bone_len
 
-        native_q = NATIVE_BONE_ROTATIONS.get(eb.name)
-        if native_q:
-            # Convert native rotation: Alchemy -> Blender, game space -> armature
-            q_blender = Quaternion(native_q).conjugated()
-            q_armature = rz90_inv @ q_blender
-            rot_mat = q_armature.to_matrix()
-
-            # Bone Y axis = tail direction in Blender convention
-            bone_dir = rot_mat @ Vector((0, 1, 0))
-            eb.tail = eb.head + bone_dir * bone_len
-        else:
-            # Non-deforming bones (Bone_000, Bip01, Motion): point upward
-            eb.tail = eb.head + Vector((0, 0, bone_len))
+        # Bone Y axis = tail direction in Blender convention. Non-deforming
+        # bones (Bone_000, Bip01, Motion) have no native axis: point upward.
+        eb.tail = head + native_axes.get(eb.name, up) * bone_len
 
     bpy.ops.object.mode_set(mode='OBJECT')
 
 
+def _display_tails_numpy(names, heads, native_axes, up, default_bone_len):
+    """Numpy version of _update_bone_display's tail computation.
+
+    Same rules: each bone's length is 80% of the distance to its nearest
+    XML2 child (ignoring children within 0.001), else default_bone_len,
+    and its tail points along its native axis (up when it has none).
+    ``heads`` is an (N, 3) array in ``names`` order; returns (N, 3) tails.
+    """
+    n = len(names)
+    index = {name: i for i, name in enumerate(names)}
+
+    # All present (parent, child) pairs -> min child distance per parent
+    pairs = [(i, index[child]) for i, name in enumerate(names)
+             for child in _XML2_CHILDREN.get(name, ()) if child in index]
+    min_child_dist = np.full(n, np.inf)
+    if pairs:
+        parent_idx, child_idx = np.array(pairs).T
+        dist = np.linalg.norm(heads[child_idx] - heads[parent_idx], axis=1)
+        dist[dist <= 0.001] = np.inf
+        np.minimum.at(min_child_dist, parent_idx, dist)
+
+    bone_len = np.where(np.isfinite(min_child_dist), min_child_dist * 0.8, 0.0)
+    bone_len[bone_len < 0.001] = default_bone_len
+
+    dirs = np.array([native_axes.get(name, up) for name in names],
+                    dtype=np.float64).reshape(n, 3)
+    return heads + dirs * bone_len[:, None]
+
+
 # ============================================================================
 # Matrix / Translation Computation
 # ============================================================================
@@ -3490,7 +3933,6 @@ def _get_game_rotation(armature_obj, converted=True):
     Returns:
         4x4 rotation Matrix.
     """
-    import math
     from mathutils import Quaternion
 
     world_q = armature_obj.matrix_world.to_quaternion()
@@ -3502,31 +3944,8 @@ def _get_game_rotation(armature_obj, converted=True):
     return game_q.to_matrix().to_4x4()
 
 
-def _compute_bone_rotation_alchemy(bone, game_rot):
-    """Derive a bone's bind-pose rotation in Alchemy convention from its rest matrix.
-
-    Used for A-pose export where we can't use the hardcoded T-pose
-    NATIVE_BONE_ROTATIONS.  Instead, we compute the rotation from the bone's
-    actual rest-pose orientation in game space.
-
-    Args:
-        bone: Blender bone (from armature.data.bones).
-        game_rot: 4x4 rotation matrix from Blender-local to game space.
-
-    Returns:
-        Quaternion in Blender convention (already conjugated from Alchemy).
-    """
-    from mathutils import Quaternion
-
-    # bone.matrix_local is the bone's rest transform in armature space.
-    # Convert to game space and extract the rotation.
-    game_mat = game_rot @ bone.matrix_local
-    q_blender = game_mat.to_quaternion()
-    return q_blender
-
-
-def _build_native_bind_matrix(name, bone, game_rot, use_native_rotations=True):
-    """Build a bind matrix using native XML2 orientation + custom bone position.
+def _native_bind_parts(name, bone, game_rot, use_native_rotations=True):
+    """Rotation and position of a bone's native bind transform.
 
     For deforming bones: native rotation + rig's game-space bone position.
     For non-deforming / unmapped: identity rotation at game-space position.
@@ -3547,33 +3966,159 @@ def _build_native_bind_matrix(name, bone, game_rot, use_native_rotations=True):
                               If False, compute from actual bone orientation.
 
     Returns:
-        4x4 Matrix: bone's bind transform in game space (unscaled).
+        (rotation, position): 3x3 rotation Matrix and game-space Vector.
     """
-    from mathutils import Matrix, Quaternion
+    from mathutils import Matrix
+
+    if not use_native_rotations and name in NATIVE_BONE_ROTATIONS:
+        # A-pose (deforming bones): the bone's actual rest orientation in
+        # game space. Rest matrices are rigid, so the normalized rotation
+        # block is exactly what a to_quaternion().to_matrix() round trip
+        # would give, and the translation is game_rot @ head_local.
+        game_mat = game_rot @ bone.matrix_local
+        return game_mat.to_3x3().normalized(), game_mat.translation
 
     bone_pos_game = game_rot @ bone.head_local
+    if use_native_rotations:
+        rot = _native_bind_rotations().get(name)
+        if rot is not None:
+            return rot, bone_pos_game
+    return Matrix.Identity(3), bone_pos_game
+
+
+def _invert_rigid(rot, pos):
+    """Inverse of the rigid transform Translation(pos) @ rot.
+
+    Bind transforms are pure rotation + translation, so the inverse is
+    [R^T | -R^T t] — no general 4x4 inversion, and never singular. The
+    result is assembled in a single Matrix construction.
+    """
+    from mathutils import Matrix
+
+    (r00, r01, r02), (r10, r11, r12), (r20, r21, r22) = rot
+    tx, ty, tz = pos
+    return Matrix((
+        (r00, r10, r20, -(r00 * tx + r10 * ty + r20 * tz)),
+        (r01, r11, r21, -(r01 * tx + r11 * ty + r21 * tz)),
+        (r02, r12, r22, -(r02 * tx + r12 * ty + r22 * tz)),
+        (0.0, 0.0, 0.0, 1.0)))
+
+
+def _native_bind_inverse_stack(xml2_bones, game_rot,
+                               use_native_rotations=True):
+    """Numpy version of _native_bind_inverses, for all bones at once.
+
+    The rotations of all present XML2 bones are stacked into an (N, 3, 3)
+    array — sliced from the native rotation table, or from the stacked rest
+    matrices for A-pose — and their game-space positions come from a single
+    matmul of the stacked heads; the rigid inverses [R^T | -R^T t] are then
+    formed for the whole stack in two array operations.
+
+    Returns:
+        (indices, positions, inverses): XML2 bone indices, the matching
+        (N, 3) game-space positions and (N, 4, 4) row-major inverses.
+    """
+    present = [(_XML2_NAMES[idx], idx, bone)
+               for idx, bone in enumerate(xml2_bones) if bone is not None]
+    n = len(present)
+
+    g = np.array(game_rot, dtype=np.float64)
+    rots = np.zeros((n, 3, 3))
+    rots[:] = np.eye(3)
+    # Only deforming bones have a native rotation; the rest keep identity
+    deforming = [i for i, (name, _, _) in enumerate(present)
+                 if name in NATIVE_BONE_ROTATIONS]
 
     if use_native_rotations:
-        native_q = NATIVE_BONE_ROTATIONS.get(name)
-        if native_q:
-            # Conjugate: Alchemy convention -> Blender convention
-            q_blender = Quaternion(native_q).conjugated()
-            rot_4x4 = q_blender.to_matrix().to_4x4()
-            return Matrix.Translation(bone_pos_game) @ rot_4x4
-        else:
-            return Matrix.Translation(bone_pos_game)
+        heads = np.array([bone.head_local for _, _, bone in present],
+                         dtype=np.float64).reshape(n, 3)
+        positions = heads @ g[:3, :3].T + g[:3, 3]
+        if deforming:
+            index, native = _native_rotation_array()
+            rots[deforming] = native[[index[present[i][0]]
+                                      for i in deforming]]
     else:
-        # A-pose: compute rotation from actual bone orientation
-        if name in NATIVE_BONE_ROTATIONS:  # only deforming bones
-            q_blender = _compute_bone_rotation_alchemy(bone, game_rot)
-            rot_4x4 = q_blender.to_matrix().to_4x4()
-            return Matrix.Translation(bone_pos_game) @ rot_4x4
-        else:
-            return Matrix.Translation(bone_pos_game)
+        # A-pose: one game_rot @ matrix_local stack gives both the
+        # positions (its translations — the heads) and, as in
+        # _native_bind_parts, the deforming bones' normalized rotations.
+        rest = np.array([bone.matrix_local for _, _, bone in present],
+                        dtype=np.float64).reshape(n, 4, 4)
+        game = np.einsum('ij,njk->nik', g, rest)
+        positions = game[:, :3, 3]
+        if deforming:
+            game_rots = game[deforming, :3, :3]
+            rots[deforming] = game_rots / np.linalg.norm(
+                game_rots, axis=1, keepdims=True)
+
+    rots_t = rots.transpose(0, 2, 1)
+    inverses = np.zeros((n, 4, 4))
+    inverses[:, :3, :3] = rots_t
+    inverses[:, :3, 3] = -np.einsum('nij,nj->ni', rots_t, positions)
+    inverses[:, 3, 3] = 1.0
+    return [idx for _, idx, _ in present], positions, inverses
+
+
+def _native_bind_inverses(xml2_bones, game_rot, use_native_rotations=True):
+    """Inverse bind matrix of every XML2 bone present, each built once.
+
+    The translation pass needs the inverse of each bone's parent bind;
+    building them up front (rather than once per child) means no bind is
+    constructed or inverted twice. ``xml2_bones`` is _xml2_bones' list.
+
+    Returns:
+        (inverses, positions): dicts XML2 bone index -> inverted 4x4 Matrix
+        and -> game-space position Vector. Bones missing from the armature
+        are absent.
+    """
+    from mathutils import Matrix, Vector
+
+    if _HAS_NUMPY:
+        indices, positions, inverses = _native_bind_inverse_stack(
+            xml2_bones, game_rot, use_native_rotations)
+        return ({idx: Matrix(m) for idx, m in zip(indices, inverses.tolist())},
+                {idx: Vector(p) for idx, p in zip(indices, positions.tolist())})
+
+    inverses = {}
+    positions = {}
+    for idx, bone in enumerate(xml2_bones):
+        if bone is None:
+            continue
+        rot, pos = _native_bind_parts(_XML2_NAMES[idx], bone, game_rot,
+                                      use_native_rotations)
+        inverses[idx] = _invert_rigid(rot, pos)
+        positions[idx] = pos
+    return inverses, positions
+
+
+def _xml2_bones(armature_obj):
+    """The armature's bone for each XML2 bone index (None when missing).
+
+    Looked up once per rebuild so the passes index a plain list instead of
+    going through the RNA collection for every bone and parent.
+    """
+    bones = armature_obj.data.bones
+    return [bones.get(display_name) for display_name in _XML2_DISPLAY_NAMES]
+
+
+def _precompute_binds(armature_obj, use_native_rotations=True, converted=True):
+    """Game rotation, inverse binds and bones shared by the skeleton passes.
+
+    _compute_inv_joint_matrices and _compute_bone_translations both need
+    them; callers running both passes compute them once here and pass the
+    result as ``binds``.
+
+    Returns:
+        (game_rot, inverses, positions) — see _get_game_rotation and
+        _native_bind_inverses.
+    """
+    game_rot = _get_game_rotation(armature_obj, converted=converted)
+    inverses, positions = _native_bind_inverses(
+        _xml2_bones(armature_obj), game_rot, use_native_rotations)
+    return game_rot, inverses, positions
 
 
 def _compute_inv_joint_matrices(armature_obj, use_native_rotations=True,
-                                converted=True):
+                                converted=True, binds=None):
     """Compute inverse joint matrices from rotations + custom positions.
 
     For each deforming bone (bm_idx >= 0), builds a bind matrix from:
@@ -3592,6 +4137,7 @@ def _compute_inv_joint_matrices(armature_obj, use_native_rotations=True,
         armature_obj: Blender armature object.
         use_native_rotations: If True, use T-pose rotations. If False, compute
                               from actual bone orientations (A-pose).
+        binds: Optional result of _precompute_binds for the same arguments.
 
     Returns:
         List of 35 entries (one per XML2 bone), each either a 16-float list
@@ -3600,38 +4146,34 @@ def _compute_inv_joint_matrices(armature_obj, use_native_rotations=True,
     n_bones = len(XML2_SKELETON)
     result = [None] * n_bones
 
-    game_rot = _get_game_rotation(armature_obj, converted=converted)
-
-    for name, idx, parent_idx, bm_idx, flags in XML2_SKELETON:
-        if bm_idx < 0:
-            continue
-
-        display_name = name if name else "Bone_000"
-        bone = armature_obj.data.bones.get(display_name)
-        if bone is None:
-            continue
-
-        bind_game = _build_native_bind_matrix(name, bone, game_rot,
-                                               use_native_rotations)
-
-        try:
-            inv_bind = bind_game.inverted()
-        except ValueError:
+    if binds is None:
+        binds = _precompute_binds(armature_obj, use_native_rotations,
+                                  converted)
+    inverses = binds[1]
+
+    if _HAS_NUMPY:
+        indices = [idx for idx in _XML2_DEFORM_IDX if idx in inverses]
+        if indices:
+            # Blender column-major -> Alchemy row-major is a transpose
+            stack = np.array([inverses[idx] for idx in indices])
+            row_major = stack.transpose(0, 2, 1).reshape(-1, 16).tolist()
+            for idx, flat in zip(indices, row_major):
+                result[idx] = flat
+        return result
+
+    for idx in _XML2_DEFORM_IDX:
+        inv_bind = inverses.get(idx)
+        if inv_bind is None:
             continue
 
         # Convert from Blender column-major to Alchemy row-major (transpose)
-        row_major = []
-        for row in range(4):
-            for col in range(4):
-                row_major.append(inv_bind[col][row])
-
-        result[idx] = row_major
+        result[idx] = [c for row in inv_bind.transposed() for c in row]
 
     return result
 
 
 def _compute_bone_translations(armature_obj, use_native_rotations=True,
-                               converted=True):
+                               converted=True, binds=None):
     """Compute bone translations (parent-local offsets) from custom positions.
 
     Alchemy FK reconstructs bone world positions as:
@@ -3645,53 +4187,36 @@ def _compute_bone_translations(armature_obj, use_native_rotations=True,
         armature_obj: Blender armature object.
         use_native_rotations: If True, use T-pose rotations for parent bind.
                               If False, compute from actual bone orientations.
+        binds: Optional result of _precompute_binds for the same arguments.
 
     Returns:
         List of 35 [x, y, z] lists, indexed by bone index.
     """
     n_bones = len(XML2_SKELETON)
-    result = [[0.0, 0.0, 0.0]] * n_bones
-
-    game_rot = _get_game_rotation(armature_obj, converted=converted)
-
-    xml2_by_idx = {}
-    for entry_name, entry_idx, entry_parent, entry_bm, entry_flags in XML2_SKELETON:
-        xml2_by_idx[entry_idx] = (entry_name, entry_parent)
-
-    for name, idx, parent_idx, bm_idx, flags in XML2_SKELETON:
-        display_name = name if name else "Bone_000"
-        bone = armature_obj.data.bones.get(display_name)
-        if bone is None:
-            result[idx] = [0.0, 0.0, 0.0]
-            continue
-
-        bone_pos_game = game_rot @ bone.head_local
-
-        if parent_idx < 0:
+    # One list per bone — missing bones keep their zero offset, and no two
+    # slots share a list, so callers may edit entries in place.
+    result = [[0.0, 0.0, 0.0] for _ in range(n_bones)]
+
+    if binds is None:
+        binds = _precompute_binds(armature_obj, use_native_rotations,
+                                  converted)
+    inverses, positions = binds[1], binds[2]
+
+    # Roots: game-space world position
+    for idx in _XML2_ROOT_IDX:
+        bone_pos_game = positions.get(idx)
+        if bone_pos_game is not None:
             result[idx] = [bone_pos_game.x, bone_pos_game.y, bone_pos_game.z]
-        else:
-            parent_entry = xml2_by_idx.get(parent_idx)
-            if parent_entry is None:
-                result[idx] = [0.0, 0.0, 0.0]
-                continue
-
-            parent_name, _ = parent_entry
-            parent_display = parent_name if parent_name else "Bone_000"
-            parent_bone = armature_obj.data.bones.get(parent_display)
 
-            if parent_bone is None:
-                result[idx] = [0.0, 0.0, 0.0]
-                continue
-
-            parent_bind = _build_native_bind_matrix(
-                parent_name, parent_bone, game_rot, use_native_rotations)
-            try:
-                local_pos = parent_bind.inverted() @ bone_pos_game
-                result[idx] = [local_pos.x, local_pos.y, local_pos.z]
-            except ValueError:
-                parent_pos_game = game_rot @ parent_bone.head_local
-                delta = bone_pos_game - parent_pos_game
-                result[idx] = [delta.x, delta.y, delta.z]
+    # Children: position in the parent's bind frame. Every present bone has
+    # both a position and an inverse, so a missing parent is the only skip.
+    for idx in _XML2_CHILD_IDX:
+        bone_pos_game = positions.get(idx)
+        parent_inv = inverses.get(_XML2_PARENT_IDX[idx])
+        if bone_pos_game is None or parent_inv is None:
+            continue
+        local_pos = parent_inv @ bone_pos_game
+        result[idx] = [local_pos.x, local_pos.y, local_pos.z]
 
     return result
 
@@ -3789,19 +4314,20 @@ def _force_native_root_translations(translations, export_scale):
     # Current Pelvis game-space position via FK (unscaled).
     # FK chain: Root(0,0,0) -> Bip01 at T[1] -> Pelvis at T[1]+T[2]
     # (Bip01 has no native rotation, so identity applies.)
-    pelvis_unscaled = [translations[1][i] + translations[2][i] for i in range(3)]
+    pelvis_unscaled = [b + p for b, p in zip(translations[1], translations[2])]
 
     # Force Bip01 (idx 1) and Motion (idx 34) to exact native values.
     native_t1 = NATIVE_TRANSLATIONS[1]    # [0.6898, 0, 41.8195] game units
     native_t34 = NATIVE_TRANSLATIONS[34]  # [0.6898, 0, 0.1495]  game units
 
+    bip01 = [v / export_scale for v in native_t1]
     translations[0] = [0.0, 0.0, 0.0]
-    translations[1] = [v / export_scale for v in native_t1]
+    translations[1] = bip01
     translations[34] = [v / export_scale for v in native_t34]
 
     # Recompute Pelvis (idx 2) as offset from forced Bip01 so that the
     # FK chain still reconstructs the actual pelvis position.
-    translations[2] = [pelvis_unscaled[i] - translations[1][i] for i in range(3)]
+    translations[2] = [p - b for p, b in zip(pelvis_unscaled, bip01)]
 
 
 def fix_root_translations(armature_obj):
@@ -3845,10 +4371,11 @@ def fix_root_translations(armature_obj):
     # consistent with each other — that consistency is what keeps the arms
     # from breaking. Roots are then normalized to Raven's vanilla pattern
     # for non-standard-size characters (Bip01 at the pelvis, Motion Z=0).
+    binds = _precompute_binds(armature_obj, True, converted=prev_converted)
     inv_matrices = _compute_inv_joint_matrices(armature_obj, True,
-                                               converted=prev_converted)
+                                               binds=binds)
     translations = _compute_bone_translations(armature_obj, True,
-                                              converted=prev_converted)
+                                              binds=binds)
     _uniform_root_translations(translations)
     # _store_skeleton_properties unconditionally sets igb_converted_rig;
     # preserve the original value
@@ -4028,6 +4555,15 @@ def apply_pose_and_rebuild(armature_obj):
 # Custom Property Storage
 # ============================================================================
 
+def _compact_json(value):
+    """json.dumps without the default separator whitespace.
+
+    The skeleton properties are only ever read back with json.loads, so
+    the padding after every ',' and ':' is pure size and encode time.
+    """
+    return json.dumps(value, separators=(',', ':'))
+
+
 def _store_skeleton_properties(armature_obj, inv_matrices, translations,
                                target_game='XML2'):
     """Store all IGB skeleton custom properties on the armature.
@@ -4064,7 +4600,7 @@ def _store_skeleton_properties(armature_obj, inv_matrices, translations,
     extended_trans = list(translations)  # copy
     while len(extended_trans) < n_skel:
         extended_trans.append([0.0, 0.0, 0.0])
-    armature_obj["igb_skin_bone_translations"] = json.dumps(extended_trans)
+    armature_obj["igb_skin_bone_translations"] = _compact_json(extended_trans)
 
     # Inverse joint matrices (indexed by bone index)
     # FX bones have bm_idx=-1 so they don't get inv_joint entries.
@@ -4072,7 +4608,7 @@ def _store_skeleton_properties(armature_obj, inv_matrices, translations,
     extended_inv = list(inv_matrices)  # copy
     while len(extended_inv) < n_skel:
         extended_inv.append(None)
-    armature_obj["igb_skin_inv_joint_matrices"] = json.dumps(extended_inv)
+    armature_obj["igb_skin_inv_joint_matrices"] = _compact_json(extended_inv)
 
     # Complete bone info list (the authoritative source for export)
     bone_info_list = []
@@ -4084,11 +4620,11 @@ def _store_skeleton_properties(armature_obj, inv_matrices, translations,
             'bm_idx': bm_idx,
             'flags': flags,
         })
-    armature_obj["igb_skin_bone_info_list"] = json.dumps(bone_info_list)
+    armature_obj["igb_skin_bone_info_list"] = _compact_json(bone_info_list)
 
     # BMS palette: identity [0, 1, 2, ..., 31] for 32 deforming bones
     bms_palette = list(range(joint_count))
-    armature_obj["igb_bms_palette"] = json.dumps(bms_palette)
+    armature_obj["igb_bms_palette"] = _compact_json(bms_palette)
 
     # Flag: rig was converted from non-XML2 convention.  The exporter uses
     # this to apply the 90° Z axis rotation to mesh vertices (converting
@@ -4096,16 +4632,22 @@ def _store_skeleton_properties(armature_obj, inv_matrices, translations,
     # with the same rotation baked in, so it just needs the normal export scale.
     armature_obj["igb_converted_rig"] = True
 
-    # Per-bone metadata on pose bones
+    # Per-bone metadata on pose bones. One pass over pose.bones for the
+    # lookup, one property-group update per bone for the writes.
+    pose_map = {pb.name: pb for pb in armature_obj.pose.bones}
     for name, idx, parent_idx, bm_idx, flags in skeleton:
         display_name = name if name else "Bone_000"
-        if display_name in armature_obj.pose.bones:
-            pb = armature_obj.pose.bones[display_name]
-            pb["igb_bone_index"] = idx
-            pb["igb_parent_idx"] = parent_idx
-            pb["igb_skin_bm_idx"] = bm_idx if bm_idx >= 0 else idx
-            pb["igb_bm_idx"] = bm_idx if bm_idx >= 0 else idx
-            pb["igb_flags"] = flags
+        pb = pose_map.get(display_name)
+        if pb is not None:
+            skin_bm_idx = bm_idx if bm_idx >= 0 else idx
+            metadata = {
+                "igb_bone_index": idx,
+                "igb_parent_idx": parent_idx,
+                "igb_skin_bm_idx": skin_bm_idx,
+                "igb_bm_idx": skin_bm_idx,
+                "igb_flags": flags,
+            }
             # Tag FX bones for easy identification
             if name in MUA_FX_BONE_NAMES:
-                pb["igb_fx_bone"] = True
+                metadata["igb_fx_bone"] = True
+            pb.id_properties_ensure().update(metadata)
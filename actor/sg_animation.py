@@ -52,12 +52,21 @@ igEnbayaAnimationSource:
     slot 5: Enum (_playMode)
 """
 
+import array
 import struct
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Dict
+from typing import Callable, List, Optional, Tuple
 
 from ..igb_format.igb_objects import IGBObject, IGBMemoryBlock
 
+# Bits for the igAnimation field scans: stop walking once all are seen
+_FOUND_NAME = 0x01
+_FOUND_PRIORITY = 0x02
+_FOUND_DURATION = 0x04
+_FOUND_TRACKS = 0x08
+_FOUND_ALL = 0x0F
+
 # Channel bitmask constants
 CHANNEL_TRANSLATION = 0x01
 CHANNEL_QUATERNION = 0x02
@@ -65,16 +74,20 @@ CHANNEL_EULER = 0x04
 CHANNEL_SCALE = 0x08
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedKeyframe:
-    """A single keyframe for one bone."""
+    """A single keyframe for one bone.
+
+    Slotted: long clips hold one of these per key per bone, and dropping
+    the per-instance __dict__ more than halves their footprint.
+    """
     time_ms: float              # time in milliseconds
     quaternion: Tuple[float, float, float, float]  # (w, x, y, z) Blender order
     translation: Tuple[float, float, float]        # (x, y, z)
     scale: Optional[Tuple[float, float, float]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedAnimationTrack:
     """Animation track for one bone."""
     bone_name: str
@@ -83,22 +96,29 @@ class ParsedAnimationTrack:
     is_constant: bool = False   # True if track uses constant quat/xlate only
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedAnimation:
     """A complete animation clip."""
     name: str
     duration_ms: float          # in milliseconds
     tracks: List[ParsedAnimationTrack]
     priority: int = 0
-    source_obj: Optional[IGBObject] = field(default=None, repr=False)
+    # Reader index of the source igAnimation. An index rather than the
+    # object itself, so cached results don't pin the whole parse tree.
+    source_index: int = field(default=-1, repr=False)
 
 
-def extract_animations(reader, skeleton=None) -> List[ParsedAnimation]:
+def extract_animations(reader, skeleton=None,
+                       name_filter: Optional[Callable[[str], bool]] = None
+                       ) -> List[ParsedAnimation]:
     """Extract all animations from an IGB file.
 
     Args:
         reader: IGBReader instance (already parsed).
         skeleton: Optional ParsedSkeleton for bone name mapping.
+        name_filter: Optional predicate on the animation name. Animations
+            it rejects are skipped before their tracks are parsed (and
+            before any Enbaya blob is decompressed).
 
     Returns:
         List of ParsedAnimation.
@@ -113,10 +133,13 @@ def extract_animations(reader, skeleton=None) -> List[ParsedAnimation]:
     # Key: igEnbayaAnimationSource object index -> decompressed per-track keyframes.
     enbaya_cache = {}
 
+    s = reader.slot_offset  # v4/v5 slots are +1 vs v6
     results = []
     for anim_obj in anim_objs:
         if not isinstance(anim_obj, IGBObject):
             continue
+        if name_filter is not None and not name_filter(_scan_name_duration(anim_obj, s)[0]):
+            continue
         parsed = _parse_animation(reader, anim_obj, skeleton, enbaya_cache)
         if parsed:
             results.append(parsed)
@@ -137,18 +160,29 @@ def extract_animation_names(reader) -> List[Tuple[str, float]]:
     for obj in anim_objs:
         if not isinstance(obj, IGBObject):
             continue
-        name = ""
-        duration_ns = 0
-        for slot, val, fi in obj._raw_fields:
-            if fi.short_name == b"String":
-                name = val if isinstance(val, str) else ""
-            elif fi.short_name == b"Long" and slot == 9 + s:
-                duration_ns = val
+        name, duration_ns = _scan_name_duration(obj, s)
         results.append((name, duration_ns / 1_000_000.0))  # ns -> ms
 
     return results
 
 
+def _scan_name_duration(anim_obj, s):
+    """Read just the name and _duration (ns) of an igAnimation."""
+    name = ""
+    duration_ns = 0
+    found = 0
+    for slot, val, fi in anim_obj._raw_fields:
+        if fi.short_name == b"String":
+            name = val if isinstance(val, str) else ""
+            found |= _FOUND_NAME
+        elif fi.short_name == b"Long" and slot == 9 + s:
+            duration_ns = val
+            found |= _FOUND_DURATION
+        if found == _FOUND_NAME | _FOUND_DURATION:
+            break
+    return name, duration_ns
+
+
 def _find_anim_list(reader, anim_db_obj):
     """Find the igAnimationList from an igAnimationDatabase."""
     s = reader.slot_offset  # v4/v5 slots are +1 vs v6
@@ -160,51 +194,52 @@ def _find_anim_list(reader, anim_db_obj):
     return None
 
 
-def _parse_animation(reader, anim_obj, skeleton=None, enbaya_cache=None) -> Optional[ParsedAnimation]:
+def _parse_animation(reader, anim_obj, skeleton=None,
+                     enbaya_cache=None) -> Optional[ParsedAnimation]:
     """Parse a single igAnimation into a ParsedAnimation."""
     endian = reader.header.endian
     name = ""
     priority = 0
     duration_ns = 0
-    track_list_ref = None
-    binding_list_ref = None
+    track_list = None
 
     if enbaya_cache is None:
         enbaya_cache = {}
 
     s = reader.slot_offset  # v4/v5 slots are +1 vs v6
+    found = 0
     for slot, val, fi in anim_obj._raw_fields:
         if fi.short_name == b"String":
             name = val if isinstance(val, str) else ""
+            found |= _FOUND_NAME
         elif fi.short_name == b"Int" and slot == 3 + s:
             priority = val
+            found |= _FOUND_PRIORITY
         elif fi.short_name == b"Long" and slot == 9 + s:
             duration_ns = val
-        elif fi.short_name == b"ObjectRef" and val != -1:
+            found |= _FOUND_DURATION
+        elif fi.short_name == b"ObjectRef" and slot == 5 + s and val != -1:
+            # Only the track list is used; the binding list (slot 4) is not
+            # resolved. Keep the resolved list so it is not looked up again.
             ref = reader.resolve_ref(val)
-            if isinstance(ref, IGBObject):
-                if ref.is_type(b"igAnimationTrackList") or (slot == 5 + s and ref.is_type(b"igObjectList")):
-                    track_list_ref = val
-                elif ref.is_type(b"igAnimationBindingList") or (slot == 4 + s and ref.is_type(b"igObjectList")):
-                    binding_list_ref = val
-
-    # Parse binding to get bone->track mapping
-    bone_track_map = None
-    if binding_list_ref is not None:
-        bone_track_map = _parse_binding(reader, binding_list_ref, endian)
+            if isinstance(ref, IGBObject) and (
+                    ref.is_type(b"igAnimationTrackList")
+                    or ref.is_type(b"igObjectList")):
+                track_list = ref
+                found |= _FOUND_TRACKS
+        if found == _FOUND_ALL:
+            break  # skip the trailing fields (_bitMask etc.)
 
     # Parse tracks
     tracks = []
-    if track_list_ref is not None:
-        tl = reader.resolve_ref(track_list_ref)
-        if isinstance(tl, IGBObject):
-            track_objs = reader.resolve_object_list(tl)
-            for ti, track_obj in enumerate(track_objs):
-                if not isinstance(track_obj, IGBObject):
-                    continue
-                track = _parse_track(reader, track_obj, ti, endian, enbaya_cache)
-                if track:
-                    tracks.append(track)
+    if track_list is not None:
+        track_objs = reader.resolve_object_list(track_list)
+        for ti, track_obj in enumerate(track_objs):
+            if not isinstance(track_obj, IGBObject):
+                continue
+            track = _parse_track(reader, track_obj, ti, endian, enbaya_cache)
+            if track:
+                tracks.append(track)
 
     duration_ms = duration_ns / 1_000_000.0
 
@@ -213,69 +248,28 @@ def _parse_animation(reader, anim_obj, skeleton=None, enbaya_cache=None) -> Opti
         duration_ms=duration_ms,
         tracks=tracks,
         priority=priority,
-        source_obj=anim_obj,
+        source_index=anim_obj.index,
     )
 
 
-def _parse_binding(reader, binding_list_ref, endian) -> Optional[Dict[int, int]]:
-    """Parse igAnimationBinding to get bone_index -> track_index mapping.
-
-    Returns:
-        Dict mapping bone_index -> track_index, or None.
-    """
-    bl = reader.resolve_ref(binding_list_ref)
-    if not isinstance(bl, IGBObject):
-        return None
-
-    bindings = reader.resolve_object_list(bl)
-    for binding in bindings:
-        if not isinstance(binding, IGBObject):
-            continue
-
-        bind_count = 0
-        track_idx_ref = None
-
-        s = reader.slot_offset  # v4/v5 slots are +1 vs v6
-        for slot, val, fi in binding._raw_fields:
-            if fi.short_name == b"MemoryRef" and val != -1:
-                track_idx_ref = val
-            elif fi.short_name == b"Int" and slot == 4 + s:
-                bind_count = val
-
-        if track_idx_ref is not None:
-            block = reader.resolve_ref(track_idx_ref)
-            if isinstance(block, IGBMemoryBlock) and block.data:
-                n = block.mem_size // 4
-                values = struct.unpack_from(endian + "i" * n, block.data, 0)
-                mapping = {}
-                for bone_idx, track_idx in enumerate(values):
-                    if track_idx >= 0:
-                        mapping[bone_idx] = track_idx
-                return mapping
-
-    return None
-
-
 def _parse_track(reader, track_obj, track_index, endian, enbaya_cache=None) -> Optional[ParsedAnimationTrack]:
     """Parse a single igAnimationTrack."""
-    bone_name = ""
-    source_ref = None
-    const_quat = (0.0, 0.0, 0.0, 1.0)  # XYZW identity
-    const_xlate = (0.0, 0.0, 0.0)
-
     if enbaya_cache is None:
         enbaya_cache = {}
 
     s = reader.slot_offset  # v4/v5 slots are +1 vs v6
-    for slot, val, fi in track_obj._raw_fields:
-        if fi.short_name == b"String":
-            bone_name = val if isinstance(val, str) else ""
-        elif fi.short_name == b"ObjectRef" and val != -1 and slot == 3 + s:
-            source_ref = val
-        elif fi.short_name in (b"Vec4f", b"Quaternionf"):
-            const_quat = val  # (x, y, z, w) Alchemy order
-        elif fi.short_name == b"Vec3f":
-            const_xlate = val
+    fields = track_obj.field_table()
+    bone_name = fields.get((b"String", 2 + s), "")
+    if not isinstance(bone_name, str):
+        bone_name = ""
+    source_ref = fields.get((b"ObjectRef", 3 + s), -1)
+    if source_ref == -1:
+        source_ref = None
+    # _constantQuaternion is (x, y, z, w) Alchemy order, XYZW identity
+    const_quat = fields.get((b"Vec4f", 4 + s),
+                            fields.get((b"Quaternionf", 4 + s),
+                                       (0.0, 0.0, 0.0, 1.0)))
+    const_xlate = fields.get((b"Vec3f", 5 + s), (0.0, 0.0, 0.0))
 
     # Try to parse the source
     keyframes = []
@@ -283,13 +277,10 @@ def _parse_track(reader, track_obj, track_index, endian, enbaya_cache=None) -> O
 
     if source_ref is not None:
         src = reader.resolve_ref(source_ref)
-        if isinstance(src, IGBObject):
-            if src.is_type(b"igTransformSequence1_5") or src.is_type(b"igTransformSequence"):
-                keyframes = _parse_transform_sequence(reader, src, endian)
-                is_constant = len(keyframes) == 0
-            elif src.is_type(b"igEnbayaTransformSource"):
-                keyframes = _parse_enbaya_source(reader, src, endian, enbaya_cache)
-                is_constant = len(keyframes) == 0
+        parser = _source_parser(src) if isinstance(src, IGBObject) else None
+        if parser is not None:
+            keyframes = parser(reader, src, endian, enbaya_cache)
+            is_constant = len(keyframes) == 0
 
     # If no keyframes from source, use constant values
     if not keyframes:
@@ -323,22 +314,13 @@ def _parse_transform_sequence(reader, seq_obj, endian) -> List[ParsedKeyframe]:
         slot 11: ObjectRef (_timeListLong -> igLongList)
         slot 15: UnsignedChar (_drivenChannels bitmask)
     """
-    xlate_list_ref = None
-    quat_list_ref = None
-    time_list_ref = None
-    driven_channels = 0x03  # default: translation + quaternion
-
     s = reader.slot_offset  # v4/v5 slots are +1 vs v6
-    for slot, val, fi in seq_obj._raw_fields:
-        if fi.short_name == b"ObjectRef" and val != -1:
-            if slot == 2 + s:
-                xlate_list_ref = val
-            elif slot == 3 + s:
-                quat_list_ref = val
-            elif slot == 11 + s:
-                time_list_ref = val
-        elif fi.short_name == b"UnsignedChar" and slot == 15 + s:
-            driven_channels = val
+    fields = seq_obj.field_table()
+    xlate_list_ref = fields.get((b"ObjectRef", 2 + s))
+    quat_list_ref = fields.get((b"ObjectRef", 3 + s))
+    time_list_ref = fields.get((b"ObjectRef", 11 + s))
+    # default: translation + quaternion
+    driven_channels = fields.get((b"UnsignedChar", 15 + s), 0x03)
 
     # Parse time list
     times_ns = _parse_long_list(reader, time_list_ref, endian)
@@ -354,26 +336,19 @@ def _parse_transform_sequence(reader, seq_obj, endian) -> List[ParsedKeyframe]:
     if num_keys == 0:
         return []
 
-    keyframes = []
-    for i in range(num_keys):
-        time_ms = times_ns[i] / 1_000_000.0 if i < len(times_ns) else 0.0
-
-        # Quaternion: Alchemy XYZW -> Blender WXYZ
-        if i < len(quats):
-            q = quats[i]
-            quat = (q[3], q[0], q[1], q[2])  # (w, x, y, z)
-        else:
-            quat = (1.0, 0.0, 0.0, 0.0)
-
-        xlate = xlates[i] if i < len(xlates) else (0.0, 0.0, 0.0)
+    times_ms = [t / 1_000_000.0 for t in times_ns]
+    # Quaternion: Alchemy XYZW -> Blender WXYZ
+    quats = [(w, x, y, z) for x, y, z, w in quats]
 
-        keyframes.append(ParsedKeyframe(
-            time_ms=time_ms,
-            quaternion=quat,
-            translation=xlate,
-        ))
+    # Pad short channels with zero time / identity rotation / zero offset
+    times_ms += [0.0] * (num_keys - len(times_ms))
+    quats += [(1.0, 0.0, 0.0, 0.0)] * (num_keys - len(quats))
+    xlates += [(0.0, 0.0, 0.0)] * (num_keys - len(xlates))
 
-    return keyframes
+    return [
+        ParsedKeyframe(time_ms=t, quaternion=q, translation=xl)
+        for t, q, xl in zip(times_ms, quats, xlates)
+    ]
 
 
 def _parse_enbaya_source(reader, src_obj, endian, enbaya_cache=None) -> List[ParsedKeyframe]:
@@ -422,7 +397,9 @@ def _parse_enbaya_source(reader, src_obj, endian, enbaya_cache=None) -> List[Par
             if fi.short_name == b"MemoryRef" and val != -1:
                 block = reader.resolve_ref(val)
                 if isinstance(block, IGBMemoryBlock) and block.data and block.mem_size > 0:
-                    blob_data = bytes(block.data[:block.mem_size])
+                    # block.data is already an exact-size bytes object, so
+                    # this slice returns it as-is rather than copying it
+                    blob_data = block.data[:block.mem_size]
                     break
 
         if blob_data is None or len(blob_data) < 80:
@@ -449,8 +426,9 @@ def _parse_enbaya_source(reader, src_obj, endian, enbaya_cache=None) -> List[Par
                 try:
                     # Decompress to per-track keyframes
                     # Each track is a list of (time_ms, quat_wxyz, trans_xyz)
+                    # Reuse the validated header rather than re-parsing it
                     tracks = decompress_enbaya_to_tracks(
-                        blob_data, endian=endian, fps=30.0
+                        blob_data, endian=endian, fps=30.0, stream=_hdr
                     )
                     enbaya_cache[cache_key] = tracks
                 except Exception:
@@ -474,74 +452,62 @@ def _parse_enbaya_source(reader, src_obj, endian, enbaya_cache=None) -> List[Par
     return keyframes
 
 
-def _parse_long_list(reader, ref, endian):
-    """Parse igLongList (ObjectRef) into a list of int64 values."""
-    if ref is None or ref == -1:
-        return []
-    obj = reader.resolve_ref(ref)
-    if not isinstance(obj, IGBObject):
-        return []
+# Track source type -> keyframe parser(reader, src, endian, enbaya_cache)
+_SOURCE_PARSERS = {
+    b"igTransformSequence1_5":
+        lambda reader, src, endian, cache: _parse_transform_sequence(reader, src, endian),
+    b"igTransformSequence":
+        lambda reader, src, endian, cache: _parse_transform_sequence(reader, src, endian),
+    b"igEnbayaTransformSource": _parse_enbaya_source,
+}
 
-    # igLongList is an igObjectList variant with a data block of int64 values
-    data_ref = None
-    count = 0
-    for slot, val, fi in obj._raw_fields:
-        if fi.short_name == b"Int" and count == 0:
-            count = val
-        elif fi.short_name == b"MemoryRef" and val != -1:
-            data_ref = val
 
-    if data_ref is None or count == 0:
-        return []
+def _source_parser(src):
+    """Pick the keyframe parser for a track source object, or None."""
+    if src.meta_object is None:
+        return None
+    parser = _SOURCE_PARSERS.get(src.meta_object.name)
+    if parser is None:
+        # Subclass of a known source type: fall back to the inheritance check
+        for type_name, candidate in _SOURCE_PARSERS.items():
+            if src.is_type(type_name):
+                return candidate
+    return parser
 
-    block = reader.resolve_ref(data_ref)
-    if not isinstance(block, IGBMemoryBlock) or not block.data:
-        return []
 
-    result = []
-    for i in range(min(count, block.mem_size // 8)):
-        val = struct.unpack_from(endian + "q", block.data, i * 8)[0]
-        result.append(val)
-    return result
+_NATIVE_ENDIAN = "<" if sys.byteorder == "little" else ">"
 
 
-def _parse_quatf_list(reader, ref, endian):
-    """Parse igQuaternionfList into list of (x,y,z,w) tuples."""
-    if ref is None or ref == -1:
-        return []
-    obj = reader.resolve_ref(ref)
-    if not isinstance(obj, IGBObject):
-        return []
+def _int_array(data, endian, typecode, count):
+    """Read `count` integers of array `typecode` from the start of data.
 
-    data_ref = None
-    count = 0
-    for slot, val, fi in obj._raw_fields:
-        if fi.short_name == b"Int" and count == 0:
-            count = val
-        elif fi.short_name == b"MemoryRef" and val != -1:
-            data_ref = val
+    The whole run is loaded in one copy and byte-swapped once, in C, when
+    the file's byte order differs from the host's.
+    """
+    values = array.array(typecode)
+    values.frombytes(data[:count * values.itemsize])
+    if endian != _NATIVE_ENDIAN:
+        values.byteswap()
+    return values.tolist()
 
-    if data_ref is None or count == 0:
-        return []
 
-    block = reader.resolve_ref(data_ref)
-    if not isinstance(block, IGBMemoryBlock) or not block.data:
-        return []
+# Key list element layouts, compiled once per byte order rather than per call
+_QUAT_STRUCTS = {e: struct.Struct(e + "ffff") for e in "<>"}
+_VEC3_STRUCTS = {e: struct.Struct(e + "fff") for e in "<>"}
 
-    result = []
-    for i in range(min(count, block.mem_size // 16)):
-        x, y, z, w = struct.unpack_from(endian + "ffff", block.data, i * 16)
-        result.append((x, y, z, w))
-    return result
 
+def _resolve_list_data(reader, ref):
+    """Resolve an ig*List ObjectRef to its (memory block, element count).
 
-def _parse_vec3f_list(reader, ref, endian):
-    """Parse igVec3fList into list of (x,y,z) tuples."""
+    The typed lists (igLongList, igQuaternionfList, igVec3fList) are
+    igObjectList variants: an Int element count plus a MemoryRef to the
+    packed element data. Returns (None, 0) if anything is missing.
+    """
     if ref is None or ref == -1:
-        return []
+        return None, 0
     obj = reader.resolve_ref(ref)
     if not isinstance(obj, IGBObject):
-        return []
+        return None, 0
 
     data_ref = None
     count = 0
@@ -551,15 +517,37 @@ def _parse_vec3f_list(reader, ref, endian):
         elif fi.short_name == b"MemoryRef" and val != -1:
             data_ref = val
 
-    if data_ref is None or count == 0:
-        return []
+    if data_ref is None or count <= 0:
+        return None, 0
 
     block = reader.resolve_ref(data_ref)
     if not isinstance(block, IGBMemoryBlock) or not block.data:
+        return None, 0
+    return block, count
+
+
+def _parse_long_list(reader, ref, endian):
+    """Parse igLongList (ObjectRef) into a list of int64 values."""
+    block, count = _resolve_list_data(reader, ref)
+    if block is None:
+        return []
+    n = min(count, block.mem_size // 8)
+    return _int_array(block.data, endian, "q", n)
+
+
+def _parse_quatf_list(reader, ref, endian):
+    """Parse igQuaternionfList into list of (x,y,z,w) tuples."""
+    block, count = _resolve_list_data(reader, ref)
+    if block is None:
         return []
+    n = min(count, block.mem_size // 16)
+    return list(_QUAT_STRUCTS[endian].iter_unpack(block.data[:n * 16]))
+
 
-    result = []
-    for i in range(min(count, block.mem_size // 12)):
-        x, y, z = struct.unpack_from(endian + "fff", block.data, i * 12)
-        result.append((x, y, z))
-    return result
+def _parse_vec3f_list(reader, ref, endian):
+    """Parse igVec3fList into list of (x,y,z) tuples."""
+    block, count = _resolve_list_data(reader, ref)
+    if block is None:
+        return []
+    n = min(count, block.mem_size // 12)
+    return list(_VEC3_STRUCTS[endian].iter_unpack(block.data[:n * 12]))
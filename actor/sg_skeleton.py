@@ -20,12 +20,12 @@ XML2 v6 field layout (verified from game files):
 
 import struct
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from ..igb_format.igb_objects import IGBObject, IGBMemoryBlock
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedBone:
     """A single bone in the skeleton hierarchy."""
     name: str
@@ -37,22 +37,34 @@ class ParsedBone:
     inv_joint_matrix: Optional[Tuple[float, ...]] = None  # 16 floats row-major, or None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedSkeleton:
     """Complete skeleton extracted from an IGB file."""
     name: str
     bones: List[ParsedBone]
     joint_count: int
+    _name_to_bone: Dict[str, ParsedBone] = field(
+        init=False, repr=False, compare=False)
+    _children: Dict[int, List[int]] = field(
+        init=False, repr=False, compare=False)
+    _bm_to_bone: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # First bone wins on duplicate names, as the old linear scan did
+        self._name_to_bone = {}
+        for bone in self.bones:
+            self._name_to_bone.setdefault(bone.name, bone)
+        self._children = {}
+        for bone in self.bones:
+            self._children.setdefault(bone.parent_idx, []).append(bone.index)
 
     def find_bone_by_name(self, name: str) -> Optional[ParsedBone]:
-        for bone in self.bones:
-            if bone.name == name:
-                return bone
-        return None
+        return self._name_to_bone.get(name)
 
     def get_children(self, bone_idx: int) -> List[int]:
         """Get indices of all direct children of a bone."""
-        return [b.index for b in self.bones if b.parent_idx == bone_idx]
+        return list(self._children.get(bone_idx, ()))
 
     def get_effective_bm_idx(self, bone_idx: int) -> int:
         """Get the effective blend matrix index for a bone.
@@ -66,12 +78,17 @@ class ParsedSkeleton:
         return bone.bm_idx
 
     def build_bm_to_bone_map(self) -> dict:
-        """Build reverse mapping: blend_matrix_index -> bone_name."""
-        mapping = {}
-        for bone in self.bones:
-            bm = self.get_effective_bm_idx(bone.index)
-            mapping[bm] = bone.name
-        return mapping
+        """Build reverse mapping: blend_matrix_index -> bone_name.
+
+        Built once and cached; callers share the returned dict.
+        """
+        if self._bm_to_bone is None:
+            mapping = {}
+            for bone in self.bones:
+                bm = self.get_effective_bm_idx(bone.index)
+                mapping[bm] = bone.name
+            self._bm_to_bone = mapping
+        return self._bm_to_bone
 
 
 def extract_skeleton(reader) -> Optional[ParsedSkeleton]:
@@ -121,8 +138,7 @@ def _find_skeleton_from_anim_db(reader, anim_db_obj) -> Optional[ParsedSkeleton]
             ref = reader.resolve_ref(val)
             if isinstance(ref, IGBObject) and ref.is_type(b"igObjectList"):
                 # Check if this list contains igSkeleton objects
-                chain = ref.meta_object.get_inheritance_chain()
-                if b"igSkeletonList" in chain or b"igObjectList" in chain:
+                if ref.is_type(b"igSkeletonList") or ref.is_type(b"igObjectList"):
                     items = reader.resolve_object_list(ref)
                     for item in items:
                         if isinstance(item, IGBObject) and item.is_type(b"igSkeleton"):
@@ -143,30 +159,17 @@ def _parse_skeleton(reader, skel_obj) -> Optional[ParsedSkeleton]:
     """
     endian = reader.header.endian
     s = reader.slot_offset  # v4/v5 slots are +1 vs v6
-    name = ""
-    trans_ref = None
-    bone_list_ref = None
-    inv_joint_ref = None
-    joint_count = 0
 
     # Extract fields by slot
-    for slot, val, fi in skel_obj._raw_fields:
-        if fi.short_name == b"String":
-            name = val if isinstance(val, str) else val.decode("utf-8", errors="replace")
-        elif fi.short_name == b"MemoryRef":
-            if slot == 3 + s:
-                trans_ref = val       # _boneTranslationArray
-            elif slot == 5 + s:
-                inv_joint_ref = val   # _invJointArray
-        elif fi.short_name == b"ObjectRef" and val != -1:
-            if slot == 4 + s:
-                bone_list_ref = val   # _boneInfoList
-        elif fi.short_name == b"Int":
-            if slot == 6 + s:
-                joint_count = val     # _jointCount
+    fields = skel_obj.field_table()
+    name = _as_str(fields.get((b"String", 2 + s), ""))
+    trans_ref = fields.get((b"MemoryRef", 3 + s))      # _boneTranslationArray
+    bone_list_ref = fields.get((b"ObjectRef", 4 + s))  # _boneInfoList
+    inv_joint_ref = fields.get((b"MemoryRef", 5 + s))  # _invJointArray
+    joint_count = fields.get((b"Int", 6 + s), 0)       # _jointCount
 
     # Parse bone info list
-    if bone_list_ref is None:
+    if bone_list_ref is None or bone_list_ref == -1:
         return None
 
     bone_infos = _parse_bone_info_list(reader, bone_list_ref)
@@ -230,25 +233,25 @@ def _parse_bone_info_list(reader, list_ref_index):
         if not isinstance(item, IGBObject):
             continue
 
-        bone_name = ""
-        parent_idx = -1
-        bm_idx = -1
-        flags = 0
+        fields = item.field_table()
+        result.append((
+            _as_str(fields.get((b"String", 2 + s), "")),
+            fields.get((b"Int", 3 + s), -1),  # parent index
+            fields.get((b"Int", 4 + s), -1),  # blend matrix index
+            fields.get((b"Int", 5 + s), 0),   # flags
+        ))
+
+    return result
 
-        for slot, val, fi in item._raw_fields:
-            if fi.short_name == b"String":
-                bone_name = val if isinstance(val, str) else val.decode("utf-8", errors="replace")
-            elif fi.short_name == b"Int":
-                if slot == 3 + s:
-                    parent_idx = val
-                elif slot == 4 + s:
-                    bm_idx = val
-                elif slot == 5 + s:
-                    flags = val
 
-        result.append((bone_name, parent_idx, bm_idx, flags))
+def _as_str(val):
+    """String field value as str (older readers hand back raw bytes)."""
+    return val if isinstance(val, str) else val.decode("utf-8", errors="replace")
 
-    return result
+
+# Array element layouts, compiled once per byte order rather than per call
+_VEC3_STRUCTS = {e: struct.Struct(e + "fff") for e in "<>"}
+_MATRIX44_STRUCTS = {e: struct.Struct(e + "16f") for e in "<>"}
 
 
 def _parse_vec3f_array(reader, endian, ref_index, expected_count):
@@ -260,15 +263,8 @@ def _parse_vec3f_array(reader, endian, ref_index, expected_count):
     if not isinstance(block, IGBMemoryBlock) or not block.data or block.mem_size == 0:
         return []
 
-    count = block.mem_size // 12
-    result = []
-    for i in range(count):
-        offset = i * 12
-        if offset + 12 <= len(block.data):
-            x, y, z = struct.unpack_from(endian + "fff", block.data, offset)
-            result.append((x, y, z))
-
-    return result
+    count = min(block.mem_size, len(block.data)) // 12
+    return list(_VEC3_STRUCTS[endian].iter_unpack(block.data[:count * 12]))
 
 
 def _parse_matrix_array(reader, endian, ref_index, expected_count):
@@ -280,12 +276,5 @@ def _parse_matrix_array(reader, endian, ref_index, expected_count):
     if not isinstance(block, IGBMemoryBlock) or not block.data or block.mem_size == 0:
         return []
 
-    count = block.mem_size // 64
-    result = []
-    for i in range(count):
-        offset = i * 64
-        if offset + 64 <= len(block.data):
-            m = struct.unpack_from(endian + "f" * 16, block.data, offset)
-            result.append(m)
-
-    return result
+    count = min(block.mem_size, len(block.data)) // 64
+    return list(_MATRIX44_STRUCTS[endian].iter_unpack(block.data[:count * 64]))
@@ -41,7 +41,30 @@ def assign_vertex_groups(mesh_obj, geometry, skeleton, bms_indices=None):
         if bone_name not in existing_groups:
             mesh_obj.vertex_groups.new(name=bone_name)
 
-    # Assign weights
+    def resolve_group(bi):
+        """Vertex group for a vertex-local blend index, or None."""
+        # Map through BlendMatrixSelect if available
+        if bms_indices is not None and bi < len(bms_indices):
+            global_bm_idx = bms_indices[bi]
+        else:
+            global_bm_idx = bi
+
+        # Look up bone name
+        bone_name = bm_to_bone.get(global_bm_idx)
+        if bone_name is None:
+            # Fallback: use bone index directly if within range
+            if global_bm_idx < len(skeleton.bones):
+                bone_name = skeleton.bones[global_bm_idx].name
+                if not bone_name:
+                    bone_name = f"Bone_{global_bm_idx:03d}"
+            else:
+                return None
+
+        return mesh_obj.vertex_groups.get(bone_name)
+
+    # Assign weights. A mesh only uses a handful of distinct blend indices,
+    # so each one is resolved to its vertex group once, not once per weight.
+    group_for_index = {}
     num_verts = min(len(geometry.blend_weights), len(geometry.blend_indices))
 
     for vi in range(num_verts):
@@ -52,24 +75,11 @@ def assign_vertex_groups(mesh_obj, geometry, skeleton, bms_indices=None):
             if w <= 0.0:
                 continue
 
-            # Map through BlendMatrixSelect if available
-            if bms_indices is not None and bi < len(bms_indices):
-                global_bm_idx = bms_indices[bi]
+            if bi in group_for_index:
+                vg = group_for_index[bi]
             else:
-                global_bm_idx = bi
-
-            # Look up bone name
-            bone_name = bm_to_bone.get(global_bm_idx)
-            if bone_name is None:
-                # Fallback: use bone index directly if within range
-                if global_bm_idx < len(skeleton.bones):
-                    bone_name = skeleton.bones[global_bm_idx].name
-                    if not bone_name:
-                        bone_name = f"Bone_{global_bm_idx:03d}"
-                else:
-                    continue
-
-            vg = mesh_obj.vertex_groups.get(bone_name)
+                vg = group_for_index[bi] = resolve_group(bi)
+
             if vg is not None:
                 vg.add([vi], w, 'REPLACE')
                 weighted_vertices.add(vi)
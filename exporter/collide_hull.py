@@ -39,6 +39,12 @@ match across all 153 game files with this no-sort ceil-left approach.
 import struct
 import math
 
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
 
 # Sentinel magic values for padding nodes in the BVH tree
 _SENTINEL_D1 = 0x7C36C81E
@@ -49,15 +55,21 @@ _SENTINEL_D2 = 0x10013D76
 # all triangles and all BVH nodes share this single fixed tag value.
 _FIXED_LEAF_TAG = 507
 
+# Precompiled little-endian layouts for the struct (no-numpy) paths
+_TRI_VERTEX = struct.Struct('<ffff')      # x, y, z, w-lane
+_BVH_NODE = struct.Struct('<ffffffff')    # min xyz, d1, max xyz, d2
+_U32 = struct.Struct('<I')
+_F32 = struct.Struct('<f')
+
 
 def _uint32_as_float(val):
     """Reinterpret a uint32 value as an IEEE 754 float (bit cast, not conversion)."""
-    return struct.unpack('<f', struct.pack('<I', val))[0]
+    return _F32.unpack(_U32.pack(val))[0]
 
 
 def _float_as_uint32(f):
     """Reinterpret an IEEE 754 float as uint32 (bit cast)."""
-    return struct.unpack('<I', struct.pack('<f', f))[0]
+    return _U32.unpack(_F32.pack(f))[0]
 
 
 def extract_collision_triangles(bl_objects, default_surface_type=0,
@@ -109,6 +121,13 @@ def extract_collision_triangles(bl_objects, default_surface_type=0,
         mesh.calc_loop_triangles()
         world_matrix = obj.matrix_world
 
+        if _HAS_NUMPY:
+            _append_mesh_triangles_numpy(
+                triangles, mesh, world_matrix, st_attr, sec_attr,
+                default_surface_type, default_secondary)
+            eval_obj.to_mesh_clear()
+            continue
+
         # Use loops (not tri.vertices) to get correct winding order.
         loops = mesh.loops
 
@@ -145,6 +164,57 @@ def extract_collision_triangles(bl_objects, default_surface_type=0,
     return triangles
 
 
+def _append_mesh_triangles_numpy(triangles, mesh, world_matrix, st_attr,
+                                 sec_attr, default_surface_type,
+                                 default_secondary):
+    """Vectorized body of extract_collision_triangles for one mesh.
+
+    Reads vertex positions, loop vertex indices and loop-triangle loops
+    with foreach_get, transforms every vertex to world space in one
+    matmul, then gathers the three corners of each triangle (loop order,
+    so winding is preserved). Appends the same dicts as the Python path.
+    """
+    num_tris = len(mesh.loop_triangles)
+    if num_tris == 0:
+        return
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    loop_vi = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vi)
+    tri_loops = np.empty(num_tris * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("loops", tri_loops)
+    poly_idx = np.empty(num_tris, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("polygon_index", poly_idx)
+
+    m = np.array(world_matrix, dtype=np.float64)
+    world = co.reshape(-1, 3) @ m[:3, :3].T + m[:3, 3]
+    tri_verts = world[loop_vi[tri_loops]].astype(np.float32).reshape(-1, 3, 3)
+
+    st_vals = _face_values_numpy(st_attr, poly_idx, default_surface_type)
+    sec_vals = _face_values_numpy(sec_attr, poly_idx, default_secondary)
+
+    for verts, st_val, sec_val in zip(tri_verts.tolist(), st_vals.tolist(),
+                                      sec_vals.tolist()):
+        triangles.append({
+            'verts': tuple(map(tuple, verts)),
+            'surface_type': st_val,
+            'secondary': sec_val,
+        })
+
+
+def _face_values_numpy(attr, poly_idx, default):
+    """Per-triangle values of a FACE int attribute, default where absent."""
+    out = np.full(len(poly_idx), default, dtype=np.int64)
+    if attr is None:
+        return out
+    values = np.empty(len(attr.data), dtype=np.int32)
+    attr.data.foreach_get("value", values)
+    in_range = poly_idx < len(values)
+    out[in_range] = values[poly_idx[in_range]]
+    return out
+
+
 def build_collision_floats(triangles, leaf_tags):
     """Pack collision triangles into the igFloatList format.
 
@@ -164,6 +234,9 @@ def build_collision_floats(triangles, leaf_tags):
         (float_data_bytes, num_triangles)
     """
     num_tris = len(triangles)
+    if _HAS_NUMPY:
+        return _pack_collision_floats_numpy(triangles, leaf_tags), num_tris
+
     num_floats = num_tris * 12
 
     data = bytearray(num_floats * 4)
@@ -177,23 +250,42 @@ def build_collision_floats(triangles, leaf_tags):
         packed_surface = _uint32_as_float(tri['surface_type'])
 
         # Vertex 0: x, y, z, 0
-        struct.pack_into('<ffff', data, offset,
-                         v0[0], v0[1], v0[2], packed_zero)
+        _TRI_VERTEX.pack_into(data, offset,
+                              v0[0], v0[1], v0[2], packed_zero)
         offset += 16
 
         # Vertex 1: x, y, z, leaf_tag
-        struct.pack_into('<ffff', data, offset,
-                         v1[0], v1[1], v1[2], packed_tag)
+        _TRI_VERTEX.pack_into(data, offset,
+                              v1[0], v1[1], v1[2], packed_tag)
         offset += 16
 
         # Vertex 2: x, y, z, surface_type
-        struct.pack_into('<ffff', data, offset,
-                         v2[0], v2[1], v2[2], packed_surface)
+        _TRI_VERTEX.pack_into(data, offset,
+                              v2[0], v2[1], v2[2], packed_surface)
         offset += 16
 
     return bytes(data), num_tris
 
 
+def _pack_collision_floats_numpy(triangles, leaf_tags):
+    """Vectorized body of build_collision_floats; returns the packed bytes.
+
+    Fills an (N, 3, 4) little-endian float32 array and writes the tag and
+    surface-type lanes through a uint32 view of the same memory, which is
+    the bit cast _uint32_as_float does one value at a time.
+    """
+    num_tris = len(triangles)
+    out = np.zeros((num_tris, 3, 4), dtype='<f4')
+    out[:, :, :3] = np.array([tri['verts'] for tri in triangles],
+                             dtype=np.float64).reshape(num_tris, 3, 3)
+    lanes = out.view('<u4')
+    # Vertex 0 keeps 0 in its w lane
+    lanes[:, 1, 3] = np.asarray(leaf_tags, dtype=np.uint32)
+    lanes[:, 2, 3] = np.fromiter((tri['surface_type'] for tri in triangles),
+                                 dtype=np.uint32, count=num_tris)
+    return out.tobytes()
+
+
 def build_bvh_tree(triangles, default_surface_type=507):
     """Build an AABB BVH tree for collision triangles.
 
@@ -226,12 +318,10 @@ def build_bvh_tree(triangles, default_surface_type=507):
         d_surface = _uint32_as_float(default_surface_type)
         sentinel_d1 = _uint32_as_float(_SENTINEL_D1)
         sentinel_d2 = _uint32_as_float(_SENTINEL_D2)
-        data = struct.pack('<ffffffff',
-                           0.0, 0.0, 0.0, d_surface,
-                           0.0, 0.0, 0.0, d_surface)
-        data += struct.pack('<ffffffff',
-                            0.0, 0.0, 0.0, sentinel_d1,
-                            0.0, 0.0, 0.0, sentinel_d2)
+        data = _BVH_NODE.pack(0.0, 0.0, 0.0, d_surface,
+                              0.0, 0.0, 0.0, d_surface)
+        data += _BVH_NODE.pack(0.0, 0.0, 0.0, sentinel_d1,
+                               0.0, 0.0, 0.0, sentinel_d2)
         return data, 1, []
 
     num_tris = len(triangles)
@@ -249,25 +339,42 @@ def build_bvh_tree(triangles, default_surface_type=507):
     # over the triangles in their existing array order.
     target_depth = int(math.log2(num_leaves)) if num_leaves > 1 else 0
 
-    nodes = [None] * num_active
+    if _HAS_NUMPY:
+        node_min, node_max = _bvh_bounds_numpy(triangles, target_depth)
+        # Every triangle lands in exactly one leaf, and all leaves share
+        # the fixed tag
+        leaf_tags = [_FIXED_LEAF_TAG] * num_tris
+        return _pack_bvh_numpy(node_min, node_max), num_active, leaf_tags
+
+    # Node AABBs in heap order, as parallel min/max lists. d1/d2 are the
+    # fixed tag on every active node, so they are not stored per node.
+    node_min = [None] * num_active
+    node_max = [None] * num_active
     leaf_tags = [0] * num_tris
 
-    _build_nosort_bvh(triangles, 0, num_tris,
-                      0, target_depth, nodes, leaf_tags)
+    # Per-triangle bounds, computed once; every node reduces over these
+    tri_min = []
+    tri_max = []
+    for tri in triangles:
+        v0, v1, v2 = tri['verts']
+        tri_min.append((min(v0[0], v1[0], v2[0]), min(v0[1], v1[1], v2[1]),
+                        min(v0[2], v1[2], v2[2])))
+        tri_max.append((max(v0[0], v1[0], v2[0]), max(v0[1], v1[1], v2[1]),
+                        max(v0[2], v1[2], v2[2])))
+
+    _build_nosort_bvh(tri_min, tri_max, 0, num_tris,
+                      0, target_depth, node_min, node_max, leaf_tags)
 
     # Pack active nodes + 1 sentinel
     total_nodes = num_active + 1
     data = bytearray(total_nodes * 32)
     offset = 0
 
-    for node in nodes:
-        mn = node['aabb_min']
-        mx = node['aabb_max']
-        d1_f = _uint32_as_float(node['d1'])
-        d2_f = _uint32_as_float(node['d2'])
-        struct.pack_into('<ffffffff', data, offset,
-                         mn[0], mn[1], mn[2], d1_f,
-                         mx[0], mx[1], mx[2], d2_f)
+    tag_f = _uint32_as_float(_FIXED_LEAF_TAG)
+    for mn, mx in zip(node_min, node_max):
+        _BVH_NODE.pack_into(data, offset,
+                            mn[0], mn[1], mn[2], tag_f,
+                            mx[0], mx[1], mx[2], tag_f)
         offset += 32
 
     # Sentinel: uses the ROOT node's AABB (node 0).
@@ -277,45 +384,109 @@ def build_bvh_tree(triangles, default_surface_type=507):
     # collision geometry. Verified: 43% of game files have sentinel == root
     # exactly; the remainder have a tighter Z range (which is harmless —
     # a slightly larger AABB just means the broad-phase passes more often).
-    root_node = nodes[0]
+    root_min = node_min[0]
+    root_max = node_max[0]
     sentinel_d1 = _uint32_as_float(_SENTINEL_D1)
     sentinel_d2 = _uint32_as_float(_SENTINEL_D2)
-    struct.pack_into('<ffffffff', data, offset,
-                     root_node['aabb_min'][0], root_node['aabb_min'][1],
-                     root_node['aabb_min'][2], sentinel_d1,
-                     root_node['aabb_max'][0], root_node['aabb_max'][1],
-                     root_node['aabb_max'][2], sentinel_d2)
+    _BVH_NODE.pack_into(data, offset,
+                        root_min[0], root_min[1], root_min[2], sentinel_d1,
+                        root_max[0], root_max[1], root_max[2], sentinel_d2)
 
     return bytes(data), total_nodes - 1, leaf_tags
 
 
-def _build_nosort_bvh(triangles, start, end,
-                      node_index, remaining_depth, nodes, leaf_tags):
+def _leaf_ranges(num_tris, target_depth):
+    """Triangle ranges [start, end) of the BVH leaves, left to right.
+
+    Applies the same ceil-left halving as _build_nosort_bvh, one level at
+    a time, so leaf k covers the triangles the engine maps to leaf k.
+    """
+    ranges = [(0, num_tris)]
+    for _ in range(target_depth):
+        split = []
+        for start, end in ranges:
+            mid = start + (end - start + 1) // 2
+            split.append((start, mid))
+            split.append((mid, end))
+        ranges = split
+    return ranges
+
+
+def _bvh_bounds_numpy(triangles, target_depth):
+    """Node AABBs of the perfect BVH, as (num_active, 3) min/max arrays.
+
+    Per-triangle bounds are reduced once per leaf, then each level of
+    internal nodes is the elementwise min/max of its two children. This
+    equals rescanning each node's triangle range, because the children's
+    ranges partition the parent's. Nodes are in heap order (children of
+    i at 2i+1, 2i+2), matching _build_nosort_bvh; empty ranges keep
+    +inf/-inf bounds as before.
+    """
+    verts = np.array([tri['verts'] for tri in triangles], dtype=np.float64)
+    verts = verts.reshape(-1, 3, 3)
+    tri_min = verts.min(axis=1)
+    tri_max = verts.max(axis=1)
+
+    num_leaves = 1 << target_depth
+    num_active = 2 * num_leaves - 1
+    node_min = np.full((num_active, 3), np.inf)
+    node_max = np.full((num_active, 3), -np.inf)
+
+    first_leaf = num_leaves - 1
+    for k, (start, end) in enumerate(_leaf_ranges(len(triangles), target_depth)):
+        if end > start:
+            node_min[first_leaf + k] = tri_min[start:end].min(axis=0)
+            node_max[first_leaf + k] = tri_max[start:end].max(axis=0)
+
+    for depth in range(target_depth - 1, -1, -1):
+        level = np.arange((1 << depth) - 1, (1 << (depth + 1)) - 1)
+        node_min[level] = np.minimum(node_min[2 * level + 1],
+                                     node_min[2 * level + 2])
+        node_max[level] = np.maximum(node_max[2 * level + 1],
+                                     node_max[2 * level + 2])
+
+    return node_min, node_max
+
+
+def _pack_bvh_numpy(node_min, node_max):
+    """Pack node AABBs plus the root-bounds sentinel into BVH tree bytes."""
+    num_active = len(node_min)
+    out = np.empty((num_active + 1, 8), dtype='<f4')
+    out[:num_active, 0:3] = node_min
+    out[:num_active, 4:7] = node_max
+    out[num_active, 0:3] = node_min[0]
+    out[num_active, 4:7] = node_max[0]
+    lanes = out.view('<u4')
+    lanes[:num_active, 3] = _FIXED_LEAF_TAG
+    lanes[:num_active, 7] = _FIXED_LEAF_TAG
+    lanes[num_active, 3] = _SENTINEL_D1
+    lanes[num_active, 7] = _SENTINEL_D2
+    return out.tobytes()
+
+
+def _build_nosort_bvh(tri_min, tri_max, start, end, node_index,
+                      remaining_depth, node_min, node_max, leaf_tags):
     """Recursively build a no-sort perfect binary tree for BVH.
 
-    Triangles are NOT reordered. Each node's AABB is computed from
-    the vertex positions of its triangle range [start, end).
+    Triangles are NOT reordered. Each node's AABB is computed from the
+    per-triangle bounds (tri_min/tri_max) of its range [start, end).
 
     Split convention: ceil-left — left child gets ceil(N/2) triangles,
     right child gets floor(N/2). This matches the game engine exactly.
 
     All nodes and triangles use fixed tag = 507 (game convention).
-    d1/d2: all nodes set to 507 (same fixed tag).
+    d1/d2: all nodes set to 507 (same fixed tag), applied when packing.
+    Writes each node's AABB tuple to node_min/node_max[node_index].
     """
-    # Compute AABB from vertex positions (not precomputed per-tri AABBs)
-    aabb_min = [float('inf')] * 3
-    aabb_max = [float('-inf')] * 3
-
-    for i in range(start, end):
-        for v in triangles[i]['verts']:
-            for j in range(3):
-                if v[j] < aabb_min[j]:
-                    aabb_min[j] = v[j]
-                if v[j] > aabb_max[j]:
-                    aabb_max[j] = v[j]
-
-    aabb_min_t = tuple(aabb_min)
-    aabb_max_t = tuple(aabb_max)
+    # Per-axis min/max over the range, reduced by the C builtins
+    if end > start:
+        min_x, min_y, min_z = zip(*tri_min[start:end])
+        max_x, max_y, max_z = zip(*tri_max[start:end])
+        aabb_min_t = (min(min_x), min(min_y), min(min_z))
+        aabb_max_t = (max(max_x), max(max_y), max(max_z))
+    else:
+        aabb_min_t = (float('inf'),) * 3
+        aabb_max_t = (float('-inf'),) * 3
 
     if remaining_depth <= 0:
         # Leaf node — assign fixed tag 507 (the game convention).
@@ -323,15 +494,10 @@ def _build_nosort_bvh(triangles, start, end,
         # of which BVH leaf they belong to. The game engine does NOT use
         # per-leaf tags for collision detection; it uses them only as
         # metadata. Using the fixed tag 507 matches game behavior exactly.
-        for i in range(start, end):
-            leaf_tags[i] = _FIXED_LEAF_TAG
-
-        nodes[node_index] = {
-            'aabb_min': aabb_min_t,
-            'aabb_max': aabb_max_t,
-            'd1': _FIXED_LEAF_TAG,
-            'd2': _FIXED_LEAF_TAG,
-        }
+        leaf_tags[start:end] = [_FIXED_LEAF_TAG] * (end - start)
+
+        node_min[node_index] = aabb_min_t
+        node_max[node_index] = aabb_max_t
         return
 
     count = end - start
@@ -346,18 +512,14 @@ def _build_nosort_bvh(triangles, start, end,
     left_idx = 2 * node_index + 1
     right_idx = 2 * node_index + 2
 
-    _build_nosort_bvh(triangles, start, mid,
-                      left_idx, remaining_depth - 1, nodes, leaf_tags)
-    _build_nosort_bvh(triangles, mid, end,
-                      right_idx, remaining_depth - 1, nodes, leaf_tags)
+    _build_nosort_bvh(tri_min, tri_max, start, mid, left_idx,
+                      remaining_depth - 1, node_min, node_max, leaf_tags)
+    _build_nosort_bvh(tri_min, tri_max, mid, end, right_idx,
+                      remaining_depth - 1, node_min, node_max, leaf_tags)
 
     # Internal node: d1 = d2 = fixed tag (game convention)
-    nodes[node_index] = {
-        'aabb_min': aabb_min_t,
-        'aabb_max': aabb_max_t,
-        'd1': _FIXED_LEAF_TAG,
-        'd2': _FIXED_LEAF_TAG,
-    }
+    node_min[node_index] = aabb_min_t
+    node_max[node_index] = aabb_max_t
 
 
 def _next_power_of_2(n):
@@ -29,6 +29,14 @@ class IGBObject:
         """Get a field value by slot number."""
         return self.fields_by_slot.get(slot, default)
 
+    def field_table(self):
+        """Map (short_name, slot) -> value for every field, in one pass.
+
+        For parsers that pick several typed slots out of one object: one
+        dict build replaces a compare chain per field.
+        """
+        return {(fi.short_name, slot): val for slot, val, fi in self._raw_fields}
+
     def is_type(self, class_name):
         """Check if this object is of or inherits from the given type."""
         if self.meta_object is None:
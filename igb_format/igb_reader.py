@@ -45,6 +45,7 @@ class IGBReader:
         self.name_pool = []     # v8+ name pool (class/string names)
         self.back_refs = {}     # tracks which objects reference which
         self._obj_list_data = set()  # indices that are igObjectList data blocks
+        self._type_index = {}   # type name -> objects of that type (lazy)
         # Opt-in: record absolute file byte offset of each object field's data
         # (keyed by (obj_index, slot)). Used by the team-menu editor to patch
         # transform matrices in place. Off by default (zero overhead).
@@ -291,6 +292,7 @@ class IGBReader:
         """
         self.ref_info = []
         self.objects = []
+        self._type_index = {}
 
         # v4/v5 slot indices are +1 relative to v6+ due to an extra
         # base class field in older Alchemy versions.
@@ -560,12 +562,16 @@ class IGBReader:
     # ---- High-level access methods ----
 
     def get_objects_by_type(self, type_name):
-        """Get all objects of a specific type (exact match or subclass)."""
-        results = []
-        for obj in self.objects:
-            if isinstance(obj, IGBObject) and obj.is_type(type_name):
-                results.append(obj)
-        return results
+        """Get all objects of a specific type (exact match or subclass).
+
+        The scan runs once per type name; later calls copy the cached list.
+        """
+        results = self._type_index.get(type_name)
+        if results is None:
+            results = [obj for obj in self.objects
+                       if isinstance(obj, IGBObject) and obj.is_type(type_name)]
+            self._type_index[type_name] = results
+        return list(results)
 
     def get_object(self, index):
         """Get the object or memory block at a given index."""
@@ -63,7 +63,7 @@ class MetaObject:
 
     __slots__ = (
         'index', 'name', 'major_version', 'minor_version',
-        'fields', 'parent_index', 'parent', 'slot_count',
+        'fields', 'parent_index', 'parent', 'slot_count', '_type_set',
     )
 
     def __init__(self, index, name, major_version, minor_version, fields,
@@ -76,6 +76,7 @@ class MetaObject:
         self.parent_index = parent_index  # -1 if no parent
         self.parent = None  # resolved parent MetaObject reference
         self.slot_count = slot_count
+        self._type_set = None  # inheritance chain as a set, built on demand
 
     def get_inheritance_chain(self):
         """Get the full inheritance chain from this class to root."""
@@ -88,7 +89,12 @@ class MetaObject:
 
     def is_subclass_of(self, class_name):
         """Check if this class is or inherits from the given class name."""
-        return class_name in self.get_inheritance_chain()
+        # Parents are resolved by parse_meta_objects before any lookup, so
+        # the chain is fixed by the time this first runs.
+        type_set = self._type_set
+        if type_set is None:
+            type_set = self._type_set = frozenset(self.get_inheritance_chain())
+        return class_name in type_set
 
     def __repr__(self):
         parent_str = f", parent={self.parent.name!r}" if self.parent else ""